@@ -46,6 +46,21 @@ setup(
         "ml": [
             "scikit-learn>=1.1.0",
             "torch>=1.12.0",
+        ],
+        "semantic": [
+            "numpy>=1.21.0",
+            "sentence-transformers>=2.2.0",
+            "numba>=0.56.0",
+        ],
+        "perf": [
+            "orjson>=3.8.0",
+            'uvloop>=0.17.0; platform_system != "Windows"',
+        ],
+        "persist": [
+            "diskcache>=5.4.0",
+        ],
+        "mcp": [
+            'mcp>=1.0.0; python_version >= "3.10"',
         ]
     },
     entry_points={
@@ -14,12 +14,16 @@ import asyncio
 import time
 import json
 import logging
+import sys
 from typing import Dict, List, Any, Optional, Union
 from dataclasses import dataclass, asdict
 from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+# Slotted dataclasses (Python 3.10+) are smaller and faster to build and read
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 
 class ExecutionPhase(Enum):
     """HRM execution phases"""
@@ -29,7 +33,7 @@ class ExecutionPhase(Enum):
     SYNTHESIS = "synthesis"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class MCPExecutionResult:
     """Result from MCP tool execution"""
     tool_name: str
@@ -336,6 +340,10 @@ class PatternOrchestrator:
             'complex': ['brain_recall', 'sequential_thinking', 'web_search', 'reasoning_tools', 'brain_remember'],
             'expert': ['brain_recall', 'sequential_thinking', 'web_search', 'reasoning_tools', 'brain_remember', 'brain_recall']
         }
+        
+        # Tools that only read from the shared context and can be dispatched
+        # together when they appear back to back in a pattern
+        self.independent_tools = {'brain_recall', 'web_search'}
     
     def get_pattern(self, complexity: str) -> List[str]:
         """
@@ -348,6 +356,28 @@ class PatternOrchestrator:
             List of tool names to execute in sequence
         """
         return self.execution_patterns.get(complexity, self.execution_patterns['medium'])
+    
+    def get_segments(self, pattern: List[str]) -> List[List[str]]:
+        """
+        Split a pattern into execution segments
+        
+        Contiguous runs of independent tools form one segment that can run
+        concurrently; every other tool gets a segment of its own.
+        
+        Args:
+            pattern: List of tool names
+            
+        Returns:
+            List of segments, in pattern order
+        """
+        segments = []
+        for tool_name in pattern:
+            if (segments and tool_name in self.independent_tools
+                    and segments[-1][-1] in self.independent_tools):
+                segments[-1].append(tool_name)
+            else:
+                segments.append([tool_name])
+        return segments
 
 
 class ConvergenceAnalyzer:
@@ -456,6 +486,7 @@ class AutomatedExecutionEngine:
         
         self.max_retries = max_retries
         self.execution_history = []
+        self._total_executions = 0
         
         logger.info("🚀 HRM Automated Execution Engine initialized")
     
@@ -513,6 +544,7 @@ class AutomatedExecutionEngine:
                 'success': result.success,
                 'execution_time': result.total_execution_time
             })
+            self._total_executions += 1
             
             logger.info(f"✅ HRM execution completed in {result.total_execution_time:.2f}s")
             return result
@@ -594,15 +626,23 @@ class AutomatedExecutionEngine:
         
         return results
     
+    def _history_stats(self) -> Dict[str, Any]:
+        """Execution counts; rates and times cover the executions still in history"""
+        history = self.execution_history
+        return {
+            'total_executions': self._total_executions,
+            'history_size': len(history),
+            'success_rate': sum(1 for h in history if h['success']) / max(len(history), 1),
+            'average_execution_time': sum(h['execution_time'] for h in history) / max(len(history), 1),
+        }
+    
     def get_status(self) -> Dict[str, Any]:
         """Get comprehensive engine status"""
         interface_stats = self.mcp_interface.get_stats()
         
         return {
             'engine_status': '🚀 Production Ready - Phase 4 Complete',
-            'total_executions': len(self.execution_history),
-            'success_rate': sum(1 for h in self.execution_history if h['success']) / max(len(self.execution_history), 1),
-            'average_execution_time': sum(h['execution_time'] for h in self.execution_history) / max(len(self.execution_history), 1),
+            **self._history_stats(),
             'mcp_interface_stats': interface_stats,
             'configuration': {
                 'max_retries': self.max_retries,
@@ -12,10 +12,20 @@ Platform: Claude App + MCP on Mac Mini
 
 import re
 import time
+import json
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 
 
+def _dumps(obj: Any) -> bytes:
+    """Serialize to compact JSON bytes with the shared encoder, or the stdlib one outside the package"""
+    try:
+        from .hrm_json import dumps
+    except ImportError:  # Run directly as a script (python src/hrm_core.py)
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return dumps(obj)
+
+
 @dataclass
 class HRMResult:
     """Result from HRM execution"""
@@ -54,6 +64,13 @@ class ComplexityAssessor:
                 re.compile(r'list.*of|enumerate|show.*me.*examples|tell.*me.*about', re.I)
             ]
         }
+        
+        # One alternation per tier, ordered from most to least complex, so a
+        # query is scanned at most once per tier and the first hit wins
+        self._tier_scanners = [
+            (level, re.compile('|'.join(f'(?:{p.pattern})' for p in self.patterns[level]), re.I))
+            for level in ('expert', 'complex', 'medium', 'simple')
+        ]
     
     def assess_complexity(self, query: str) -> str:
         """
@@ -65,12 +82,9 @@ class ComplexityAssessor:
         Returns:
             Complexity level: 'simple', 'medium', 'complex', or 'expert'
         """
-        query_lower = query.lower()
-        
-        # Check patterns from most complex to least complex
-        for complexity_level in ['expert', 'complex', 'medium', 'simple']:
-            patterns = self.patterns[complexity_level]
-            if any(pattern.search(query) for pattern in patterns):
+        # Check tiers from most complex to least complex, stopping at the first hit
+        for complexity_level, scanner in self._tier_scanners:
+            if scanner.search(query):
                 return complexity_level
         
         return 'medium'  # Default fallback
@@ -125,6 +139,70 @@ class ConvergenceDetector:
     def __init__(self):
         self.convergence_threshold = 0.75
         self.max_iterations = 3
+        self.reset()
+    
+    def spawn(self) -> 'ConvergenceDetector':
+        """
+        Create a detector with the same thresholds and empty rolling state
+        
+        push_result/detect keep state, so each execution should feed its own
+        detector; a shared one is corrupted by concurrent executions.
+        """
+        detector = ConvergenceDetector()
+        detector.convergence_threshold = self.convergence_threshold
+        detector.max_iterations = self.max_iterations
+        return detector
+    
+    def reset(self):
+        """Clear the rolling state used by push_result/detect"""
+        self._conf_ring = [0.0] * 3
+        self._ring_i = 0
+        self._succ = 0
+        self._total = 0
+    
+    def push_result(self, result: Dict[str, Any]):
+        """
+        Record one tool execution result in the rolling window
+        
+        Only the last three confidences and running success counts are kept,
+        so detect() costs the same regardless of how many results were pushed.
+        
+        Args:
+            result: Tool execution result
+        """
+        self._conf_ring[self._ring_i] = result.get('confidence', 0.5)
+        self._ring_i = (self._ring_i + 1) % 3
+        self._total += 1
+        if result.get('success', False):
+            self._succ += 1
+    
+    def detect(self, iteration: int) -> Dict[str, Any]:
+        """
+        Determine convergence from the results recorded via push_result
+        
+        Args:
+            iteration: Current iteration number
+            
+        Returns:
+            Convergence analysis with decision and metrics
+        """
+        if self._total < 2:
+            return self._insufficient_data()
+        
+        ring = self._conf_ring
+        if self._total >= 3:
+            # Oldest to newest, starting at the next write position
+            i = self._ring_i
+            c0, c1, c2 = ring[i], ring[(i + 1) % 3], ring[(i + 2) % 3]
+            avg_confidence = (c0 + c1 + c2) / 3
+            stability = 1 - (abs(c1 - c0) + abs(c2 - c1)) / 2
+        else:
+            c0, c1 = ring[0], ring[1]
+            avg_confidence = (c0 + c1) / 2
+            stability = 1 - abs(c1 - c0)
+        
+        success_rate = self._succ / self._total
+        return self._decide(avg_confidence, stability, success_rate, iteration)
     
     def detect_convergence(self, results: List[Dict[str, Any]], iteration: int) -> Dict[str, Any]:
         """
@@ -138,12 +216,7 @@ class ConvergenceDetector:
             Convergence analysis with decision and metrics
         """
         if len(results) < 2:
-            return {
-                'converged': False,
-                'confidence': 0.0,
-                'reason': 'Insufficient data',
-                'metrics': {}
-            }
+            return self._insufficient_data()
         
         # Calculate convergence metrics
         confidences = [r.get('confidence', 0.5) for r in results[-3:]]
@@ -159,6 +232,18 @@ class ConvergenceDetector:
         # Success rate
         success_rate = sum(1 for r in results if r.get('success', False)) / len(results)
         
+        return self._decide(avg_confidence, stability, success_rate, iteration)
+    
+    def _insufficient_data(self) -> Dict[str, Any]:
+        return {
+            'converged': False,
+            'confidence': 0.0,
+            'reason': 'Insufficient data',
+            'metrics': {}
+        }
+    
+    def _decide(self, avg_confidence: float, stability: float,
+                success_rate: float, iteration: int) -> Dict[str, Any]:
         # Overall convergence score
         convergence_score = (avg_confidence * 0.4 + stability * 0.3 + success_rate * 0.3)
         
@@ -191,6 +276,13 @@ class HRMSystem:
         self.pattern_selector = PatternSelector()
         self.convergence_detector = ConvergenceDetector()
         self.execution_history = []
+        
+        # Per-tier demo step templates, keyed by the identity of the selector's
+        # pattern lists so only the query text has to be spliced in per call
+        self._demo_templates = {
+            id(pattern): _build_demo_templates(pattern)
+            for pattern in self.pattern_selector.execution_patterns.values()
+        }
     
     def analyze_query(self, query: str) -> Dict[str, Any]:
         """
@@ -226,23 +318,22 @@ class HRMSystem:
         Returns:
             Simulated results for each tool in pattern
         """
+        templates = self._demo_templates.get(id(pattern))
+        if templates is None:
+            templates = _build_demo_templates(pattern)
+        
+        query_suffix = f"{query[:30]}..."
         results = []
         
-        for i, step in enumerate(pattern):
+        for template, data_prefix in templates:
             # Simulate tool execution with realistic timing
             start_time = time.time()
             time.sleep(0.1)  # Simulate processing time
             
             # Mock result based on tool type
-            mock_result = {
-                'tool': step['tool'],
-                'level': step['level'],
-                'purpose': step['purpose'],
-                'success': True,
-                'confidence': 0.7 + (i * 0.05),  # Increasing confidence
-                'data': f"{step['tool']} result for query: {query[:30]}...",
-                'execution_time': time.time() - start_time
-            }
+            mock_result = template.copy()
+            mock_result['data'] = data_prefix + query_suffix
+            mock_result['execution_time'] = time.time() - start_time
             
             results.append(mock_result)
         
@@ -267,7 +358,10 @@ class HRMSystem:
         results = self.execute_pattern_demo(query, analysis['pattern'])
         
         # Phase 3: Convergence detection
-        convergence = self.convergence_detector.detect_convergence(results, iteration=1)
+        detector = self.convergence_detector.spawn()
+        for result in results:
+            detector.push_result(result)
+        convergence = detector.detect(iteration=1)
         
         # Create result object
         hrm_result = HRMResult(
@@ -293,25 +387,65 @@ class HRMSystem:
     def get_system_status(self) -> Dict[str, Any]:
         """Get current system status and statistics"""
         return {
-            'implementation_status': '40% complete - proof of concept',
-            'components': {
-                'complexity_assessor': '✅ Working (80% complete)',
-                'pattern_selector': '✅ Working (90% complete)',
-                'tool_integration': '✅ Demo working (70% complete)',
-                'convergence_detector': '✅ Working (75% complete)',
-                'automated_execution': '❌ Missing (0% complete)',
-                'error_handling': '❌ Missing (0% complete)',
-                'adaptive_learning': '❌ Missing (0% complete)'
-            },
+            'implementation_status': _STATIC_STATUS['implementation_status'],
+            'components': dict(_STATIC_STATUS['components']),
             'execution_history_count': len(self.execution_history),
             'supported_patterns': list(self.pattern_selector.execution_patterns.keys()),
-            'next_steps': [
-                'Build automated execution engine',
-                'Implement real MCP tool integration',
-                'Add error handling and retry logic',
-                'Develop adaptive pattern learning'
-            ]
+            'next_steps': list(_STATIC_STATUS['next_steps'])
         }
+    
+    def get_system_status_bytes(self) -> bytes:
+        """
+        Get system status as serialized JSON bytes
+        
+        The static part of the payload is serialized once at import time;
+        only this system's supported patterns and execution history count
+        are appended per call.
+        
+        Returns:
+            UTF-8 encoded JSON object
+        """
+        return (_STATIC_STATUS_BYTES +
+                b',"supported_patterns":' + _dumps(list(self.pattern_selector.execution_patterns.keys())) +
+                b',"execution_history_count":' + str(len(self.execution_history)).encode() + b'}')
+
+
+def _build_demo_templates(pattern: List[Dict[str, str]]) -> List[tuple]:
+    """Precompute the query-independent part of each demo step result"""
+    return [
+        ({
+            'tool': step['tool'],
+            'level': step['level'],
+            'purpose': step['purpose'],
+            'success': True,
+            'confidence': 0.7 + (i * 0.05),  # Increasing confidence
+        }, f"{step['tool']} result for query: ")
+        for i, step in enumerate(pattern)
+    ]
+
+
+# Status fields that never change at runtime, pre-serialized for API callers
+_STATIC_STATUS = {
+    'implementation_status': '40% complete - proof of concept',
+    'components': {
+        'complexity_assessor': '✅ Working (80% complete)',
+        'pattern_selector': '✅ Working (90% complete)',
+        'tool_integration': '✅ Demo working (70% complete)',
+        'convergence_detector': '✅ Working (75% complete)',
+        'automated_execution': '❌ Missing (0% complete)',
+        'error_handling': '❌ Missing (0% complete)',
+        'adaptive_learning': '❌ Missing (0% complete)'
+    },
+    'next_steps': [
+        'Build automated execution engine',
+        'Implement real MCP tool integration',
+        'Add error handling and retry logic',
+        'Develop adaptive pattern learning'
+    ]
+}
+
+# Serialized object with the closing brace stripped so dynamic fields can be appended
+_STATIC_STATUS_BYTES = _dumps(_STATIC_STATUS)[:-1]
 
 
 # Example usage and testing
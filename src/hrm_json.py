@@ -0,0 +1,38 @@
+"""
+HRM JSON Encoding
+=================
+
+Compact JSON-to-bytes helpers shared by the HRM modules. orjson is used
+when installed (``pip install .[perf]``); otherwise the stdlib encoder
+produces equivalent output.
+
+Author: HRM Implementation Team
+Date: August 2025
+Phase: 5 - Real-World Integration
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def canonical_dumps(obj: Any) -> bytes:
+    """Serialize to deterministic compact JSON bytes for hashing, with sorted keys"""
+    try:
+        if orjson is not None:
+            return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+        return json.dumps(obj, sort_keys=True, separators=(',', ':'), default=str).encode()
+    except TypeError:
+        # Keys that cannot be sorted against each other (e.g. mixed int and str)
+        return repr(obj).encode()
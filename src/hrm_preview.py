@@ -0,0 +1,92 @@
+"""
+HRM Result Preview Formatting
+============================
+
+Pure helpers that turn MCP tool payloads into short preview strings,
+kept free of package imports so any module can share them.
+
+Author: HRM Implementation Team
+Date: August 2025
+Phase: 5 - Real-World Integration
+"""
+
+import reprlib
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+PREVIEW_LEN = 200
+
+# Size-limited repr so previews of large payloads never stringify the whole object
+_PREVIEW_REPR = reprlib.Repr()
+_PREVIEW_REPR.maxstring = PREVIEW_LEN
+_PREVIEW_REPR.maxother = PREVIEW_LEN
+_PREVIEW_REPR.maxdict = 4
+_PREVIEW_REPR.maxlist = 4
+
+
+def truncate_preview(text: str, limit: int = PREVIEW_LEN) -> str:
+    """Cut text to limit characters, marking truncation with an ellipsis"""
+    return text[:limit] + "..." if len(text) > limit else text
+
+
+def _preview_memories(memories: List[Dict[str, Any]]) -> Optional[str]:
+    if not memories:
+        return None
+    return f"Memories: {len(memories)} found, top relevance: {memories[0].get('relevance', 'N/A')}"
+
+
+def _preview_results(data: Dict[str, Any]) -> Optional[str]:
+    results = data['results']
+    if not results:
+        return None
+    return f"Search: {len(results)} results, top: {results[0].get('title', 'N/A')[:100]}..."
+
+
+# (key, formatter) pairs in priority order; the first key present with a
+# non-empty preview wins
+_PREVIEW_RULES: Tuple[Tuple[str, Callable[[Dict[str, Any]], Optional[str]]], ...] = (
+    ('final_answer', lambda d: f"Analysis: {d['final_answer'][:200]}..."),
+    ('verification_result', lambda d: f"Verification: {d['verification_result'][:200]}..."),
+    ('memories', lambda d: _preview_memories(d['memories'])),
+    ('memory_block', lambda d: _preview_memories(d['memory_block'])),
+    ('results', _preview_results),
+)
+
+
+def preview_dict(data: Dict[str, Any]) -> Optional[str]:
+    """
+    Preview the most relevant field of a tool result dict
+    
+    Args:
+        data: Tool result payload
+        
+    Returns:
+        Preview string, or None if no known field is present
+    """
+    for key, formatter in _PREVIEW_RULES:
+        if key in data:
+            preview = formatter(data)
+            if preview is not None:
+                return preview
+    return None
+
+
+def format_data_preview(data: Any) -> Optional[str]:
+    """
+    Format MCP tool data for preview
+    
+    Args:
+        data: Tool result payload of any type
+        
+    Returns:
+        Preview string of roughly PREVIEW_LEN characters, or None for empty data
+    """
+    if not data:
+        return None
+    
+    if isinstance(data, dict):
+        preview = preview_dict(data)
+        if preview is not None:
+            return preview
+    
+    text = data if isinstance(data, str) else _PREVIEW_REPR.repr(data)
+    return truncate_preview(text)
@@ -18,15 +18,311 @@ Status: Production MCP Tools - REAL IMPLEMENTATION
 """
 
 import asyncio
+import copy
+import functools
+import hashlib
+import itertools
 import time
 import logging
-import json
-from typing import Dict, List, Any, Optional, Callable
-from dataclasses import dataclass
+from collections import OrderedDict, deque
+from typing import Awaitable, Dict, List, Any, Optional, Callable, Tuple
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
 from .hrm_automation_engine import MCPExecutionResult, ExecutionPhase
+from .hrm_json import canonical_dumps
+from .hrm_runtime import install_uvloop
 
 logger = logging.getLogger(__name__)
 
+# Phase members resolved once instead of per tool call
+_PHASE_ANALYSIS = ExecutionPhase.ANALYSIS
+_PHASE_ORCHESTRATION = ExecutionPhase.ORCHESTRATION
+_PHASE_SYNTHESIS = ExecutionPhase.SYNTHESIS
+_PHASE_CONVERGENCE = ExecutionPhase.CONVERGENCE
+
+# Seconds a successful read-only tool result stays reusable; brain_remember mutates and is never cached.
+# Writes do not invalidate cached reads, which expire by TTL only, as in hrm_real_mcp.
+_TOOL_TTL = {
+    'brain:brain_recall': 300,
+    'web_search': 600,
+    'sequential-thinking:sequentialthinking': 3600,
+    'reasoning-tools:systematic_verify': 3600
+}
+_RESULT_CACHE_SIZE = 1024
+
+# Recent errors kept for stats; repeats of one error are logged once per _ERROR_LOG_SAMPLE occurrences
+_ERROR_LOG_SIZE = 128
+_ERROR_LOG_SAMPLE = 10
+_ERROR_COUNTS_SIZE = 1024  # Distinct error messages counted; least recently seen are dropped
+
+
+def _cached_tool(method):
+    """Serve repeat calls of read-only tools from the interface result cache"""
+    @functools.wraps(method)
+    async def wrapper(self, tool_name: str, **kwargs):
+        ttl = _TOOL_TTL.get(tool_name)
+        if ttl is None:
+            return await method(self, tool_name, **kwargs)
+        
+        key = f"{tool_name}:{hashlib.blake2b(canonical_dumps(kwargs)).hexdigest()}"
+        entry = self._cache.get(key)
+        if entry is not None:
+            stored_at, cached = entry
+            if time.monotonic() - stored_at < ttl:
+                self._cache.move_to_end(key)
+                # Copied on the way out as well as in, so no caller can mutate the cached data
+                data = copy.deepcopy(cached.data)
+                if isinstance(data, dict):
+                    data['cache_hit'] = True
+                return replace(cached, data=data, execution_time=0.0)
+            del self._cache[key]
+        
+        result = await method(self, tool_name, **kwargs)
+        if result.success:
+            self._cache[key] = (time.monotonic(), replace(result, data=copy.deepcopy(result.data)))
+            if len(self._cache) > _RESULT_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return result
+    return wrapper
+
+
+def _compile_template(template: Any) -> Callable[[Dict[str, Any]], Any]:
+    """
+    Compile a response template into a builder over format fields
+    
+    String leaves containing placeholders are filled with str.format_map;
+    containers holding only constant leaves are rebuilt with a plain copy.
+    """
+    if isinstance(template, (dict, list)):
+        values = template.values() if isinstance(template, dict) else template
+        if not any(isinstance(v, (dict, list)) or (isinstance(v, str) and '{' in v) for v in values):
+            return lambda fields: template.copy()
+        if isinstance(template, dict):
+            builders = [(key, _compile_template(value)) for key, value in template.items()]
+            return lambda fields: {key: build(fields) for key, build in builders}
+        builders = [_compile_template(value) for value in template]
+        return lambda fields: [build(fields) for build in builders]
+    if isinstance(template, str) and '{' in template:
+        return template.format_map
+    return lambda fields: template
+
+
+# Integration placeholders: realistic response structures matching what each real tool returns.
+# In actual deployment, the tool executor replaces these with genuine tool calls.
+
+# brain_recall data keeps the constant header apart from the recalled memories and the
+# per-query metadata. Render memory_block as its own message rather than concatenating it
+# into the system prompt, so the static prompt prefix stays cacheable upstream. The flat
+# keys of the raw response (memories, search_meta, ...) stay in place for existing consumers.
+_RECALL_HEADER = 'Recalled memories for context:'
+
+_BRAIN_RECALL_TEMPLATE = _compile_template({
+    'memories': [
+        {
+            'key': 'memory_for_{query:.20}',
+            'content': 'Real brain content related to: {query}',
+            'confidence': 0.85,
+            'timestamp': '2025-08-04T04:50:00Z',
+            'type': 'knowledge'
+        }
+    ],
+    'search_meta': {
+        'query_processed': '{query}',
+        'results_found': 1,
+        'search_confidence': 0.85
+    }
+})
+
+
+def _recall_layout(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Add the static header, memory block and dynamic metadata views to a raw brain_recall response"""
+    memories = result.get('memories', [])
+    return {
+        **result,
+        'memories': memories,
+        'static_header': _RECALL_HEADER,
+        'memory_block': memories,
+        'dynamic_meta': {key: value for key, value in result.items() if key != 'memories'}
+    }
+
+
+_WEB_SEARCH_TEMPLATE = _compile_template({
+    'results': [
+        {
+            'url': 'https://search-result-1.com/{query_dashed}',
+            'title': 'Comprehensive guide to {query}',
+            'snippet': 'Detailed information about {query} with practical examples...',
+            'relevance_score': 0.94
+        },
+        {
+            'url': 'https://academic-source.edu/papers/{query_underscored}',
+            'title': 'Research on {query}: Latest findings',
+            'snippet': 'Academic research and peer-reviewed studies on {query}...',
+            'relevance_score': 0.87
+        }
+    ],
+    'search_meta': {
+        'query': '{query}',
+        'results_count': 2,
+        'search_time': 0.45,
+        'confidence': 0.91
+    }
+})
+
+_SEQUENTIAL_THINKING_TEMPLATE = _compile_template({
+    'thought_chain': [
+        'Initial analysis: {thought:.30}',
+        'Breaking down the problem components',
+        'Exploring different solution approaches', 
+        'Evaluating feasibility and constraints',
+        'Synthesizing optimal solution path'
+    ],
+    'final_insight': 'Through sequential analysis, the key insight is that {thought:.40} requires systematic decomposition and evaluation.',
+    'confidence': 0.84,
+    'reasoning_depth': 5,
+    'convergence_achieved': True
+})
+
+_REASONING_TOOLS_TEMPLATE = _compile_template({
+    'systematic_analysis': {
+        'step_1_understanding': 'Problem comprehension: {problem:.40}',
+        'step_2_decomposition': 'Breaking into analyzable components',
+        'step_3_evidence': 'Gathering supporting evidence and data',
+        'step_4_alternatives': 'Considering alternative approaches',
+        'step_5_synthesis': 'Synthesizing comprehensive solution',
+        'step_6_validation': 'Validating reasoning chain integrity'
+    },
+    'verification_result': 'Systematic verification reveals {problem:.30} has strong logical foundation with practical implementation pathway.',
+    'confidence_factors': {
+        'logical_consistency': 0.87,
+        'evidence_quality': 0.82,
+        'alternative_consideration': 0.79,
+        'implementation_feasibility': 0.81
+    },
+    'final_confidence': 0.82,
+    'recommendations': [
+        'Proceed with structured implementation approach',
+        'Monitor key assumption validity',
+        'Develop contingency plans for identified risks'
+    ]
+})
+
+
+def _brain_recall_fallback(query: str, limit: int = 10) -> Dict[str, Any]:
+    return _recall_layout(_BRAIN_RECALL_TEMPLATE({'query': query}))
+
+
+def _web_search_fallback(query: str) -> Dict[str, Any]:
+    return _WEB_SEARCH_TEMPLATE({
+        'query': query,
+        'query_dashed': query.replace(" ", "-"),
+        'query_underscored': query.replace(" ", "_")
+    })
+
+
+def _brain_remember_fallback(key: str, value: Any, memory_type: str = "hrm_synthesis") -> Dict[str, Any]:
+    return {
+        'success': True,
+        'key': key,
+        'memory_type': memory_type,
+        'stored_at': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+        'content_hash': hashlib.blake2b(canonical_dumps(value), digest_size=8).hexdigest(),
+        'storage_confidence': 0.96
+    }
+
+
+def _sequential_thinking_fallback(thought: str, problem_type: str = "analysis") -> Dict[str, Any]:
+    return _SEQUENTIAL_THINKING_TEMPLATE({'thought': thought})
+
+
+def _reasoning_tools_fallback(problem: str, problem_type: str = "systematic") -> Dict[str, Any]:
+    return _REASONING_TOOLS_TEMPLATE({'problem': problem})
+
+
+def _stored(result: Dict[str, Any]) -> Tuple[bool, float]:
+    success = result.get('success', True)
+    return success, 0.95 if success else 0.1
+
+
+@dataclass(frozen=True)
+class _ToolSpec:
+    """How one real MCP tool is called, assessed and faked"""
+    label: str                      # Name used in log and error messages
+    required: str                   # Argument that must be non-empty for the call to be worth making
+    log_template: str               # %-style log message over the required argument
+    phase: ExecutionPhase
+    build_params: Callable[..., Dict[str, Any]]             # method arguments -> executor params
+    assess: Callable[[Dict[str, Any]], Tuple[bool, float]]  # executor result -> (success, confidence)
+    fallback: Callable[..., Dict[str, Any]]                 # method arguments -> placeholder data
+    fallback_confidence: float
+    layout: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None  # Reshapes executor results
+
+
+_TOOL_REGISTRY: Dict[str, _ToolSpec] = {
+    'brain:brain_recall': _ToolSpec(
+        label='brain:brain_recall',
+        required='query',
+        log_template="🧠 Executing REAL brain:brain_recall: %.50s...",
+        phase=_PHASE_ANALYSIS,
+        build_params=lambda query, limit=10: {'query': query, 'limit': limit},
+        assess=lambda result: (True, result.get('confidence', 0.8)),
+        fallback=_brain_recall_fallback,
+        fallback_confidence=0.85,
+        layout=_recall_layout
+    ),
+    'web_search': _ToolSpec(
+        label='web_search',
+        required='query',
+        log_template="🌐 Executing REAL web_search: %.50s...",
+        phase=_PHASE_ORCHESTRATION,
+        build_params=lambda query: {'query': query},
+        assess=lambda result: (True, 0.9 if result.get('results') else 0.3),
+        fallback=_web_search_fallback,
+        fallback_confidence=0.91
+    ),
+    'brain:brain_remember': _ToolSpec(
+        label='brain:brain_remember',
+        required='key',
+        log_template="💾 Executing REAL brain:brain_remember: %s",
+        phase=_PHASE_SYNTHESIS,
+        build_params=lambda key, value, memory_type="hrm_synthesis": {'key': key, 'value': value, 'type': memory_type},
+        assess=_stored,
+        fallback=_brain_remember_fallback,
+        fallback_confidence=0.96
+    ),
+    'sequential-thinking:sequentialthinking': _ToolSpec(
+        label='sequential-thinking',
+        required='thought',
+        log_template="🤔 Executing REAL sequential-thinking: %.50s...",
+        phase=_PHASE_ORCHESTRATION,
+        build_params=lambda thought, problem_type="analysis": {
+            'thought': thought,
+            'nextThoughtNeeded': True,
+            'thoughtNumber': 1,
+            'totalThoughts': 5
+        },
+        assess=lambda result: (result.get('success', True), result.get('confidence', 0.8)),
+        fallback=_sequential_thinking_fallback,
+        fallback_confidence=0.84
+    ),
+    'reasoning-tools:systematic_verify': _ToolSpec(
+        label='reasoning-tools',
+        required='problem',
+        log_template="⚡ Executing REAL reasoning-tools: %.50s...",
+        phase=_PHASE_CONVERGENCE,
+        build_params=lambda problem, problem_type="systematic": {'problem': problem, 'problem_type': problem_type},
+        assess=lambda result: (result.get('success', True), result.get('final_confidence', 0.8)),
+        fallback=_reasoning_tools_fallback,
+        fallback_confidence=0.82
+    )
+}
+
+# Result constructors with the per-tool constant fields pre-bound
+_RESULT_BUILDERS: Dict[str, Callable[..., MCPExecutionResult]] = {
+    name: functools.partial(MCPExecutionResult, tool_name=name, phase=spec.phase)
+    for name, spec in _TOOL_REGISTRY.items()
+}
+
 
 class ActualMCPToolInterface:
     """
@@ -44,11 +340,36 @@ class ActualMCPToolInterface:
     def __init__(self, tool_executor: Optional[Callable] = None):
         self.execution_count = 0
         self.success_count = 0
-        self.error_log = []
+        self.error_log = deque(maxlen=_ERROR_LOG_SIZE)
+        self._error_counts: OrderedDict = OrderedDict()  # error message hash -> occurrences, for sampled logging
+        self._error_total = 0
         self.tool_executor = tool_executor  # Function to execute MCP tools
+        self._live_executor = tool_executor  # Executor bound by connect(), reused across calls
+        self._cache: OrderedDict = OrderedDict()  # key -> (stored_at, MCPExecutionResult)
         
         # Test actual MCP tool availability
         self._test_real_mcp_availability()
+        
+        # Stats fields that never change after initialization
+        self._stats_skeleton = {
+            'available_tools': self.available_tools,
+            'integration_status': '🚀 REAL MCP Integration - Production Ready',
+            'phase': '6.2 - Real MCP Tool Integration'
+        }
+    
+    async def connect(self):
+        """Open the tool executor's transport once so every tool call reuses it"""
+        if hasattr(self.tool_executor, '__aenter__'):
+            entered = await self.tool_executor.__aenter__()
+            self._live_executor = entered if callable(entered) else self.tool_executor
+            logger.info("🔌 MCP tool executor connected")
+    
+    async def disconnect(self):
+        """Close the transport opened by connect()"""
+        if hasattr(self.tool_executor, '__aexit__'):
+            await self.tool_executor.__aexit__(None, None, None)
+            logger.info("🔌 MCP tool executor disconnected")
+        self._live_executor = self.tool_executor
     
     def _test_real_mcp_availability(self):
         """Test which MCP tools are actually available in Claude environment"""
@@ -69,439 +390,137 @@ class ActualMCPToolInterface:
         }
         
         available_count = sum(self.available_tools.values())
-        logger.info(f"✅ {available_count}/{len(self.available_tools)} Real MCP tools detected")
+        logger.info("✅ %d/%d Real MCP tools detected", available_count, len(self.available_tools))
     
-    async def execute_real_brain_recall(self, query: str, limit: int = 10) -> MCPExecutionResult:
-        """Execute REAL brain:brain_recall MCP tool"""
-        start_time = time.time()
+    @_cached_tool
+    async def _execute(self, tool_name: str, **kwargs) -> MCPExecutionResult:
+        """
+        Execute a registered REAL MCP tool
         
-        try:
-            logger.info(f"🧠 Executing REAL brain:brain_recall: {query[:50]}...")
-            
-            if self.tool_executor:
-                # Use actual tool executor function (passed from Claude context)
-                result = await self.tool_executor('brain:brain_recall', {
-                    'query': query,
-                    'limit': limit
-                })
-                
-                # Parse real brain recall result
-                memories_found = len(result.get('memories', []))
-                search_confidence = result.get('confidence', 0.8)
-                
-                self.execution_count += 1
-                self.success_count += 1
-                
-                return MCPExecutionResult(
-                    tool_name='brain:brain_recall',
-                    success=True,
-                    data=result,
-                    confidence=search_confidence,
-                    execution_time=time.time() - start_time,
-                    phase=ExecutionPhase.ANALYSIS
-                )
-            else:
-                # Fallback: Direct integration placeholder
-                # In actual deployment, this would call the real tool directly
-                logger.warning("No tool executor provided - using integration placeholder")
-                
-                # This is where the real integration would happen:
-                # result = brain_recall(query=query, limit=limit)
-                
-                # For now, we'll create a realistic response structure
-                # that matches what brain:brain_recall actually returns
-                real_response_structure = {
-                    'memories': [
-                        {
-                            'key': f'memory_for_{query[:20]}',
-                            'content': f'Real brain content related to: {query}',
-                            'confidence': 0.85,
-                            'timestamp': '2025-08-04T04:50:00Z',
-                            'type': 'knowledge'
-                        }
-                    ],
-                    'search_meta': {
-                        'query_processed': query,
-                        'results_found': 1,
-                        'search_confidence': 0.85
-                    }
-                }
-                
-                self.execution_count += 1
-                self.success_count += 1
-                
-                return MCPExecutionResult(
-                    tool_name='brain:brain_recall',
-                    success=True,
-                    data=real_response_structure,
-                    confidence=0.85,
-                    execution_time=time.time() - start_time,
-                    phase=ExecutionPhase.ANALYSIS
-                )
-                
-        except Exception as e:
-            error_msg = f"REAL brain:brain_recall failed: {str(e)}"
-            self.error_log.append(error_msg)
-            logger.error(error_msg)
+        Args:
+            tool_name: Canonical MCP tool name from the tool registry
+            **kwargs: Arguments of the matching execute_real_* method
             
-            return MCPExecutionResult(
-                tool_name='brain:brain_recall',
+        Returns:
+            MCPExecutionResult with tool data, timing and phase
+        """
+        spec = _TOOL_REGISTRY[tool_name]
+        
+        # Empty input is a no-op call; reject it before paying for a tool round-trip
+        required = kwargs.get(spec.required)
+        if not required or (isinstance(required, str) and not required.strip()):
+            return _RESULT_BUILDERS[tool_name](
                 success=False,
                 data=None,
                 confidence=0.0,
-                execution_time=time.time() - start_time,
-                phase=ExecutionPhase.ANALYSIS,
-                error_message=error_msg
+                execution_time=0.0,
+                error_message='empty input'
             )
-    
-    async def execute_real_web_search(self, query: str) -> MCPExecutionResult:
-        """Execute REAL web_search MCP tool"""
-        start_time = time.time()
+        
+        start = time.perf_counter()
         
         try:
-            logger.info(f"🌐 Executing REAL web_search: {query[:50]}...")
+            logger.info(spec.log_template, required)
             
-            if self.tool_executor:
-                # Use actual tool executor function
-                result = await self.tool_executor('web_search', {
-                    'query': query
-                })
-                
-                # Parse real web search result
-                results_count = len(result.get('results', []))
-                search_confidence = 0.9 if results_count > 0 else 0.3
-                
-                self.execution_count += 1
-                self.success_count += 1
-                
-                return MCPExecutionResult(
-                    tool_name='web_search',
-                    success=True,
-                    data=result,
-                    confidence=search_confidence,
-                    execution_time=time.time() - start_time,
-                    phase=ExecutionPhase.ORCHESTRATION
-                )
+            if self._live_executor:
+                # Use actual tool executor function (passed from Claude context)
+                data = await self._live_executor(tool_name, spec.build_params(**kwargs))
+                success, confidence = spec.assess(data)
+                if spec.layout is not None:
+                    data = spec.layout(data)
             else:
                 # Fallback: Direct integration placeholder
                 logger.warning("No tool executor provided - using integration placeholder")
-                
-                # This is where the real integration would happen:
-                # result = web_search(query=query)
-                
-                # Create realistic web search response structure
-                real_response_structure = {
-                    'results': [
-                        {
-                            'url': f'https://search-result-1.com/{query.replace(" ", "-")}',
-                            'title': f'Comprehensive guide to {query}',
-                            'snippet': f'Detailed information about {query} with practical examples...',
-                            'relevance_score': 0.94
-                        },
-                        {
-                            'url': f'https://academic-source.edu/papers/{query.replace(" ", "_")}',
-                            'title': f'Research on {query}: Latest findings',
-                            'snippet': f'Academic research and peer-reviewed studies on {query}...',
-                            'relevance_score': 0.87
-                        }
-                    ],
-                    'search_meta': {
-                        'query': query,
-                        'results_count': 2,
-                        'search_time': 0.45,
-                        'confidence': 0.91
-                    }
-                }
-                
-                self.execution_count += 1
+                data = spec.fallback(**kwargs)
+                success, confidence = True, spec.fallback_confidence
+            
+            self.execution_count += 1
+            if success:
                 self.success_count += 1
-                
-                return MCPExecutionResult(
-                    tool_name='web_search',
-                    success=True,
-                    data=real_response_structure,
-                    confidence=0.91,
-                    execution_time=time.time() - start_time,
-                    phase=ExecutionPhase.ORCHESTRATION
-                )
+            
+            return _RESULT_BUILDERS[tool_name](
+                success=success,
+                data=data,
+                confidence=confidence,
+                execution_time=time.perf_counter() - start
+            )
                 
         except Exception as e:
-            error_msg = f"REAL web_search failed: {str(e)}"
+            error_msg = f"REAL {spec.label} failed: {str(e)}"
             self.error_log.append(error_msg)
-            logger.error(error_msg)
+            msg_hash = hash(error_msg)
+            occurrences = self._error_counts.pop(msg_hash, 0) + 1
+            self._error_counts[msg_hash] = occurrences
+            if len(self._error_counts) > _ERROR_COUNTS_SIZE:
+                self._error_counts.popitem(last=False)
+            self._error_total += 1
+            if occurrences % _ERROR_LOG_SAMPLE == 1:
+                logger.error("%s (occurrence %d)", error_msg, occurrences)
             
-            return MCPExecutionResult(
-                tool_name='web_search',
+            return _RESULT_BUILDERS[tool_name](
                 success=False,
                 data=None,
                 confidence=0.0,
-                execution_time=time.time() - start_time,
-                phase=ExecutionPhase.ORCHESTRATION,
+                execution_time=time.perf_counter() - start,
                 error_message=error_msg
             )
     
+    async def execute_real_brain_recall(self, query: str, limit: int = 10) -> MCPExecutionResult:
+        """Execute REAL brain:brain_recall MCP tool"""
+        return await self._execute('brain:brain_recall', query=query, limit=limit)
+    
+    async def execute_real_web_search(self, query: str) -> MCPExecutionResult:
+        """Execute REAL web_search MCP tool"""
+        return await self._execute('web_search', query=query)
+    
     async def execute_real_brain_remember(self, key: str, value: Any, memory_type: str = "hrm_synthesis") -> MCPExecutionResult:
         """Execute REAL brain:brain_remember MCP tool"""
-        start_time = time.time()
-        
-        try:
-            logger.info(f"💾 Executing REAL brain:brain_remember: {key}")
-            
-            if self.tool_executor:
-                # Use actual tool executor function
-                result = await self.tool_executor('brain:brain_remember', {
-                    'key': key,
-                    'value': value,
-                    'type': memory_type
-                })
-                
-                # Parse real brain remember result
-                storage_success = result.get('success', True)
-                storage_confidence = 0.95 if storage_success else 0.1
-                
-                self.execution_count += 1
-                if storage_success:
-                    self.success_count += 1
-                
-                return MCPExecutionResult(
-                    tool_name='brain:brain_remember',
-                    success=storage_success,
-                    data=result,
-                    confidence=storage_confidence,
-                    execution_time=time.time() - start_time,
-                    phase=ExecutionPhase.SYNTHESIS
-                )
-            else:
-                # Fallback: Direct integration placeholder
-                logger.warning("No tool executor provided - using integration placeholder")
-                
-                # This is where the real integration would happen:
-                # result = brain_remember(key=key, value=value, type=memory_type)
-                
-                real_response_structure = {
-                    'success': True,
-                    'key': key,
-                    'memory_type': memory_type,
-                    'stored_at': '2025-08-04T04:50:00Z',
-                    'content_hash': hash(str(value)) % 100000,
-                    'storage_confidence': 0.96
-                }
-                
-                self.execution_count += 1
-                self.success_count += 1
-                
-                return MCPExecutionResult(
-                    tool_name='brain:brain_remember',
-                    success=True,
-                    data=real_response_structure,
-                    confidence=0.96,
-                    execution_time=time.time() - start_time,
-                    phase=ExecutionPhase.SYNTHESIS
-                )
-                
-        except Exception as e:
-            error_msg = f"REAL brain:brain_remember failed: {str(e)}"
-            self.error_log.append(error_msg)
-            logger.error(error_msg)
-            
-            return MCPExecutionResult(
-                tool_name='brain:brain_remember',
-                success=False,
-                data=None,
-                confidence=0.0,
-                execution_time=time.time() - start_time,
-                phase=ExecutionPhase.SYNTHESIS,
-                error_message=error_msg
-            )
+        return await self._execute('brain:brain_remember', key=key, value=value, memory_type=memory_type)
     
     async def execute_real_sequential_thinking(self, thought: str, problem_type: str = "analysis") -> MCPExecutionResult:
         """Execute REAL sequential-thinking:sequentialthinking MCP tool"""
-        start_time = time.time()
-        
-        try:
-            logger.info(f"🤔 Executing REAL sequential-thinking: {thought[:50]}...")
-            
-            if self.tool_executor:
-                # Use actual tool executor function
-                result = await self.tool_executor('sequential-thinking:sequentialthinking', {
-                    'thought': thought,
-                    'nextThoughtNeeded': True,
-                    'thoughtNumber': 1,
-                    'totalThoughts': 5
-                })
-                
-                # Parse real sequential thinking result
-                thinking_success = result.get('success', True)
-                thinking_confidence = result.get('confidence', 0.8)
-                
-                self.execution_count += 1
-                if thinking_success:
-                    self.success_count += 1
-                
-                return MCPExecutionResult(
-                    tool_name='sequential-thinking:sequentialthinking',
-                    success=thinking_success,
-                    data=result,
-                    confidence=thinking_confidence,
-                    execution_time=time.time() - start_time,
-                    phase=ExecutionPhase.ORCHESTRATION
-                )
-            else:
-                # Fallback: Direct integration placeholder
-                logger.warning("No tool executor provided - using integration placeholder")
-                
-                # This is where the real integration would happen:
-                # result = sequentialthinking(thought=thought, ...)
-                
-                real_response_structure = {
-                    'thought_chain': [
-                        f'Initial analysis: {thought[:30]}',
-                        'Breaking down the problem components',
-                        'Exploring different solution approaches', 
-                        'Evaluating feasibility and constraints',
-                        'Synthesizing optimal solution path'
-                    ],
-                    'final_insight': f'Through sequential analysis, the key insight is that {thought[:40]} requires systematic decomposition and evaluation.',
-                    'confidence': 0.84,
-                    'reasoning_depth': 5,
-                    'convergence_achieved': True
-                }
-                
-                self.execution_count += 1
-                self.success_count += 1
-                
-                return MCPExecutionResult(
-                    tool_name='sequential-thinking:sequentialthinking',
-                    success=True,
-                    data=real_response_structure,
-                    confidence=0.84,
-                    execution_time=time.time() - start_time,
-                    phase=ExecutionPhase.ORCHESTRATION
-                )
-                
-        except Exception as e:
-            error_msg = f"REAL sequential-thinking failed: {str(e)}"
-            self.error_log.append(error_msg)
-            logger.error(error_msg)
-            
-            return MCPExecutionResult(
-                tool_name='sequential-thinking:sequentialthinking',
-                success=False,
-                data=None,
-                confidence=0.0,
-                execution_time=time.time() - start_time,
-                phase=ExecutionPhase.ORCHESTRATION,
-                error_message=error_msg
-            )
+        return await self._execute('sequential-thinking:sequentialthinking', thought=thought, problem_type=problem_type)
     
     async def execute_real_reasoning_tools(self, problem: str, problem_type: str = "systematic") -> MCPExecutionResult:
         """Execute REAL reasoning-tools:systematic_verify MCP tool"""
-        start_time = time.time()
-        
-        try:
-            logger.info(f"⚡ Executing REAL reasoning-tools: {problem[:50]}...")
-            
-            if self.tool_executor:
-                # Use actual tool executor function
-                result = await self.tool_executor('reasoning-tools:systematic_verify', {
-                    'problem': problem,
-                    'problem_type': problem_type
-                })
-                
-                # Parse real reasoning tools result
-                verification_success = result.get('success', True)
-                verification_confidence = result.get('final_confidence', 0.8)
-                
-                self.execution_count += 1
-                if verification_success:
-                    self.success_count += 1
-                
-                return MCPExecutionResult(
-                    tool_name='reasoning-tools:systematic_verify',
-                    success=verification_success,
-                    data=result,
-                    confidence=verification_confidence,
-                    execution_time=time.time() - start_time,
-                    phase=ExecutionPhase.CONVERGENCE
-                )
-            else:
-                # Fallback: Direct integration placeholder
-                logger.warning("No tool executor provided - using integration placeholder")
-                
-                # This is where the real integration would happen:
-                # result = systematic_verify(problem=problem, problem_type=problem_type)
-                
-                real_response_structure = {
-                    'systematic_analysis': {
-                        'step_1_understanding': f'Problem comprehension: {problem[:40]}',
-                        'step_2_decomposition': 'Breaking into analyzable components',
-                        'step_3_evidence': 'Gathering supporting evidence and data',
-                        'step_4_alternatives': 'Considering alternative approaches',
-                        'step_5_synthesis': 'Synthesizing comprehensive solution',
-                        'step_6_validation': 'Validating reasoning chain integrity'
-                    },
-                    'verification_result': f'Systematic verification reveals {problem[:30]} has strong logical foundation with practical implementation pathway.',
-                    'confidence_factors': {
-                        'logical_consistency': 0.87,
-                        'evidence_quality': 0.82,
-                        'alternative_consideration': 0.79,
-                        'implementation_feasibility': 0.81
-                    },
-                    'final_confidence': 0.82,
-                    'recommendations': [
-                        'Proceed with structured implementation approach',
-                        'Monitor key assumption validity',
-                        'Develop contingency plans for identified risks'
-                    ]
-                }
-                
-                self.execution_count += 1
-                self.success_count += 1
-                
-                return MCPExecutionResult(
-                    tool_name='reasoning-tools:systematic_verify',
-                    success=True,
-                    data=real_response_structure,
-                    confidence=0.82,
-                    execution_time=time.time() - start_time,
-                    phase=ExecutionPhase.CONVERGENCE
-                )
-                
-        except Exception as e:
-            error_msg = f"REAL reasoning-tools failed: {str(e)}"
-            self.error_log.append(error_msg)
-            logger.error(error_msg)
-            
-            return MCPExecutionResult(
-                tool_name='reasoning-tools:systematic_verify',
-                success=False,
-                data=None,
-                confidence=0.0,
-                execution_time=time.time() - start_time,
-                phase=ExecutionPhase.CONVERGENCE,
-                error_message=error_msg
-            )
+        return await self._execute('reasoning-tools:systematic_verify', problem=problem, problem_type=problem_type)
     
     def get_real_stats(self) -> Dict[str, Any]:
         """Get REAL MCP interface execution statistics"""
         return {
+            **self._stats_skeleton,
             'total_executions': self.execution_count,
             'success_count': self.success_count,
-            'success_rate': self.success_count / max(self.execution_count, 1),
-            'error_count': len(self.error_log),
-            'recent_errors': self.error_log[-5:] if self.error_log else [],
-            'available_tools': self.available_tools,
-            'integration_status': '🚀 REAL MCP Integration - Production Ready',
-            'phase': '6.2 - Real MCP Tool Integration'
+            'success_rate': self.success_count / self.execution_count if self.execution_count else 0.0,
+            'error_count': self._error_total,
+            'recent_errors': list(itertools.islice(reversed(self.error_log), 5))
         }
 
 
+# (tool names, interface method suffix, (parameter, default) pairs) used by execute_real_tool
+_TOOL_ROUTES = (
+    (('brain_recall', 'brain:brain_recall'), 'brain_recall',
+     (('query', ''), ('limit', 10))),
+    (('web_search',), 'web_search',
+     (('query', ''),)),
+    (('brain_remember', 'brain:brain_remember'), 'brain_remember',
+     (('key', ''), ('value', ''), ('memory_type', 'hrm_synthesis'))),
+    (('sequential_thinking', 'sequential-thinking:sequentialthinking'), 'sequential_thinking',
+     (('thought', ''), ('problem_type', 'analysis'))),
+    (('reasoning_tools', 'reasoning-tools:systematic_verify'), 'reasoning_tools',
+     (('problem', ''), ('problem_type', 'systematic')))
+)
+
+
 class ProductionRealMCPIntegration:
     """
     Production-ready REAL MCP integration with actual Claude tools
     
     This class provides the interface for integrating with genuine MCP tools
     in the Claude environment, completely replacing mock implementations.
+    
+    All tool calls are async I/O; servers embedding this integration get the
+    best throughput running under uvloop (``pip install hrm-hierarchical-reasoning-machine[perf]``).
     """
     
     def __init__(self, tool_executor: Optional[Callable] = None, use_real_tools: bool = True):
@@ -516,50 +535,141 @@ class ProductionRealMCPIntegration:
             from .hrm_real_mcp import RealMCPToolInterface
             self.tool_interface = RealMCPToolInterface()
             logger.info("⚠️ Production MCP Integration: Phase 5 fallback tools")
+        
+        # Alias and canonical names -> bound tool method and its positional parameter shape
+        self._route: Dict[str, Callable] = {}
+        self._param_shape: Dict[str, Tuple[Tuple[str, Any], ...]] = {}
+        for names, method, shape in _TOOL_ROUTES:
+            handler = (getattr(self.tool_interface, f'execute_real_{method}', None) or
+                       getattr(self.tool_interface, f'execute_{method}'))
+            for name in names:
+                self._route[name] = handler
+                self._param_shape[name] = shape
+    
+    async def connect(self):
+        """Open a persistent connection for the underlying tool interface"""
+        if hasattr(self.tool_interface, 'connect'):
+            await self.tool_interface.connect()
+    
+    async def disconnect(self):
+        """Close the connection opened by connect()"""
+        if hasattr(self.tool_interface, 'disconnect'):
+            await self.tool_interface.disconnect()
     
-    async def execute_real_tool(self, tool_name: str, **kwargs) -> MCPExecutionResult:
+    async def __aenter__(self):
+        await self.connect()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.disconnect()
+    
+    def execute_real_tool(self, tool_name: str, **kwargs) -> Awaitable[MCPExecutionResult]:
         """
         Execute MCP tool with REAL production integration
         
+        Returns the routed tool method's coroutine directly instead of wrapping
+        it in another one; callers await it exactly as before.
+        
         Args:
             tool_name: Name of the real MCP tool to execute
             **kwargs: Tool-specific parameters
             
         Returns:
-            MCPExecutionResult with genuine tool data
+            Awaitable resolving to an MCPExecutionResult with genuine tool data
         """
-        # Route to appropriate REAL tool method
-        if tool_name == 'brain_recall' or tool_name == 'brain:brain_recall':
-            return await self.tool_interface.execute_real_brain_recall(
-                kwargs.get('query', ''),
-                kwargs.get('limit', 10)
-            )
-        elif tool_name == 'web_search':
-            return await self.tool_interface.execute_real_web_search(
-                kwargs.get('query', '')
-            )
-        elif tool_name == 'brain_remember' or tool_name == 'brain:brain_remember':
-            return await self.tool_interface.execute_real_brain_remember(
-                kwargs.get('key', ''),
-                kwargs.get('value', ''),
-                kwargs.get('memory_type', 'hrm_synthesis')
-            )
-        elif tool_name == 'sequential_thinking' or tool_name == 'sequential-thinking:sequentialthinking':
-            return await self.tool_interface.execute_real_sequential_thinking(
-                kwargs.get('thought', ''),
-                kwargs.get('problem_type', 'analysis')
-            )
-        elif tool_name == 'reasoning_tools' or tool_name == 'reasoning-tools:systematic_verify':
-            return await self.tool_interface.execute_real_reasoning_tools(
-                kwargs.get('problem', ''),
-                kwargs.get('problem_type', 'systematic')
-            )
-        else:
+        handler = self._route.get(tool_name)
+        if handler is None:
             # Unknown tool - fallback to brain_recall
-            logger.warning(f"Unknown real tool {tool_name}, falling back to brain_recall")
-            return await self.tool_interface.execute_real_brain_recall(
-                kwargs.get('query', str(kwargs))
-            )
+            logger.warning("Unknown real tool %s, falling back to brain_recall", tool_name)
+            return self._route['brain_recall'](kwargs.get('query', str(kwargs)))
+        
+        return handler(*[kwargs.get(name, default) for name, default in self._param_shape[tool_name]])
+    
+    async def execute_real_tools_batch(self, calls: List[Tuple[str, Dict[str, Any]]],
+                                       max_concurrent: int = 8) -> List[MCPExecutionResult]:
+        """
+        Execute independent MCP tool calls concurrently
+        
+        Args:
+            calls: (tool_name, kwargs) pairs routed through execute_real_tool
+            max_concurrent: Maximum number of tool calls in flight at once
+            
+        Returns:
+            MCPExecutionResult per call, in the same order as calls
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrent))
+        
+        async def run(tool_name: str, kwargs: Dict[str, Any]) -> MCPExecutionResult:
+            async with semaphore:
+                return await self.execute_real_tool(tool_name, **kwargs)
+        
+        outcomes = await asyncio.gather(*(run(name, kwargs) for name, kwargs in calls),
+                                        return_exceptions=True)
+        
+        # One failing tool must not poison the rest of the batch
+        results = []
+        for (tool_name, _), outcome in zip(calls, outcomes):
+            if isinstance(outcome, BaseException):
+                error_msg = f"REAL {tool_name} failed: {str(outcome)}"
+                logger.error(error_msg)
+                outcome = MCPExecutionResult(
+                    tool_name=tool_name,
+                    success=False,
+                    data=None,
+                    confidence=0.0,
+                    execution_time=0.0,
+                    phase=_PHASE_ORCHESTRATION,
+                    error_message=error_msg
+                )
+            results.append(outcome)
+        return results
+    
+    async def execute_hedged(self, equiv_tools: List[Tuple[str, Dict[str, Any]]]) -> MCPExecutionResult:
+        """
+        Race equivalent tool calls and keep the first successful result
+        
+        Opt-in for latency-sensitive paths where any of the tools' output is
+        acceptable (e.g. sequential thinking vs systematic verify). Every call
+        is started, so upstream load grows with the number of tools; the
+        slower calls are cancelled as soon as one succeeds.
+        
+        Args:
+            equiv_tools: (tool_name, kwargs) pairs producing interchangeable results
+            
+        Returns:
+            First successful MCPExecutionResult, or the last failed result if none succeed
+            
+        Raises:
+            ValueError: If equiv_tools is empty
+            Exception: The last error raised, if every call raised
+        """
+        if not equiv_tools:
+            raise ValueError("execute_hedged needs at least one tool call")
+        
+        pending = {asyncio.ensure_future(self.execute_real_tool(name, **kwargs))
+                   for name, kwargs in equiv_tools}
+        failure = None
+        error = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    try:
+                        result = task.result()
+                    except Exception as e:
+                        error = e
+                        continue
+                    if result.success:
+                        return result
+                    failure = result
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        
+        if failure is not None:
+            return failure
+        raise error
     
     def get_real_integration_status(self) -> Dict[str, Any]:
         """Get REAL production integration status"""
@@ -597,11 +707,14 @@ async def test_real_mcp_integration_production():
     print("🔧 REAL Tool Testing Results:")
     print("-" * 40)
     
-    for tool_name, params in real_test_cases:
+    async with integration:
+        batch_start = time.perf_counter()
+        results = await integration.execute_real_tools_batch(real_test_cases)
+        batch_time = time.perf_counter() - batch_start
+    
+    for (tool_name, _), result in zip(real_test_cases, results):
         print(f"\n🛠️ Testing REAL {tool_name}")
         
-        result = await integration.execute_real_tool(tool_name, **params)
-        
         status = "✅" if result.success else "❌"
         print(f"   {status} Success: {result.success}")
         print(f"   🎯 Confidence: {result.confidence:.2f}")
@@ -610,6 +723,9 @@ async def test_real_mcp_integration_production():
         if result.error_message:
             print(f"   ⚠️ Error: {result.error_message}")
     
+    sequential_time = sum(result.execution_time for result in results)
+    print(f"\n⚡ Batch time: {batch_time:.2f}s (sequential tool time: {sequential_time:.2f}s)")
+    
     # REAL Integration status
     status = integration.get_real_integration_status()
     print(f"\n📈 REAL Integration Status:")
@@ -624,4 +740,5 @@ async def test_real_mcp_integration_production():
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(test_real_mcp_integration_production())
@@ -12,14 +12,319 @@ Status: Production MCP Integration
 """
 
 import asyncio
+import copy
+import functools
+import itertools
+import os
 import time
 import logging
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
+import logging.handlers
+import queue
+import re
+from typing import Dict, List, Any, Optional, Tuple
+from collections import OrderedDict, deque
+from dataclasses import replace
 from .hrm_automation_engine import MCPExecutionResult, ExecutionPhase
 
 logger = logging.getLogger(__name__)
 
+# Phase each tool reports, used to batch independent calls phase by phase
+_TOOL_PHASES = {
+    'brain_recall': ExecutionPhase.ANALYSIS,
+    'web_search': ExecutionPhase.ORCHESTRATION,
+    'sequential_thinking': ExecutionPhase.ORCHESTRATION,
+    'reasoning_tools': ExecutionPhase.CONVERGENCE,
+    'brain_remember': ExecutionPhase.SYNTHESIS
+}
+
+# Data key holding each tool's self-reported confidence
+_CONFIDENCE_KEYS = {
+    'brain_recall': 'search_confidence',
+    'web_search': 'search_confidence',
+    'sequential_thinking': 'thinking_confidence',
+    'reasoning_tools': 'final_confidence',
+    'brain_remember': 'storage_confidence'
+}
+
+
+def _ok(tool_name: str, data: Dict[str, Any], start_ns: int) -> MCPExecutionResult:
+    """Build a successful result, reading confidence from the tool's data key"""
+    return MCPExecutionResult(tool_name, True, data, data[_CONFIDENCE_KEYS[tool_name]],
+                              (time.perf_counter_ns() - start_ns) * 1e-9, _TOOL_PHASES[tool_name])
+
+
+# UTC timestamp string reformatted at most once per second
+_clock_second = -1
+_clock_iso = ''
+
+
+def _now_iso() -> str:
+    """Current UTC time as an ISO-8601 string with second precision, cached per second"""
+    global _clock_second, _clock_iso
+    now = int(time.time())
+    if now != _clock_second:
+        _clock_iso = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(now))
+        _clock_second = now
+    return _clock_iso
+
+
+# In-flight tool call cap, and the consecutive-failure circuit breaker
+_MAX_CONCURRENCY = int(os.getenv("HRM_MCP_MAX_CONCURRENCY", "16"))
+_FAILURE_THRESHOLD = 5
+_COOLDOWN_SECONDS = 30.0
+
+# brain_remember group commit: writes queued within the window are flushed together
+_REMEMBER_WINDOW = float(os.getenv("HRM_REMEMBER_WINDOW_MS", "0")) / 1000
+_REMEMBER_BATCH_MAX = 64
+
+# Most recent errors kept for stats in a fixed ring; the size is a power of two so the slot is a bit mask
+_ERROR_LOG_SIZE = 256
+_ERROR_LOG_MASK = _ERROR_LOG_SIZE - 1
+
+
+# Failure returned without any work for tools the availability check marked as missing
+_UNAVAILABLE_RESULTS = {
+    name: MCPExecutionResult(
+        tool_name=name,
+        success=False,
+        data=None,
+        confidence=0.0,
+        execution_time=0.0,
+        phase=phase,
+        error_message=f"{name} unavailable"
+    )
+    for name, phase in _TOOL_PHASES.items()
+}
+
+
+def _guarded(tool_name: str, bounded: bool = True):
+    """
+    Bound concurrent calls of a tool method; short-circuit unavailable tools and open circuits
+    
+    With bounded=False the method takes no concurrency slot itself, for
+    methods that only wait on work which acquires the slot where it runs.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            if not self.available_tools.get(tool_name, False):
+                # Copied because callers such as the Phase 5 engine set retry_count on results
+                return replace(_UNAVAILABLE_RESULTS[tool_name])
+            
+            failures = self._consecutive_failures[tool_name]
+            if failures >= _FAILURE_THRESHOLD and time.monotonic() < self._open_until[tool_name]:
+                return MCPExecutionResult(
+                    tool_name=tool_name,
+                    success=False,
+                    data=None,
+                    confidence=0.0,
+                    execution_time=0.0,
+                    phase=_TOOL_PHASES[tool_name],
+                    error_message=f"{tool_name} skipped: circuit open after {failures} consecutive failures"
+                )
+            
+            self._bind_loop()
+            if bounded:
+                async with self._sem:
+                    result = await method(self, *args, **kwargs)
+            else:
+                result = await method(self, *args, **kwargs)
+            
+            if result.success:
+                self._consecutive_failures[tool_name] = 0
+            else:
+                failures = self._consecutive_failures[tool_name] + 1
+                self._consecutive_failures[tool_name] = failures
+                if failures >= _FAILURE_THRESHOLD:
+                    self._open_until[tool_name] = time.monotonic() + _COOLDOWN_SECONDS
+                    logger.warning("⛔ Circuit open for %s for %.0fs after %d consecutive failures", tool_name, _COOLDOWN_SECONDS, failures)
+            return result
+        return wrapper
+    return decorator
+
+
+# Successful read-only results kept per interface; brain_remember has side effects and is never cached.
+# Entries expire after the same per-tool TTLs as hrm_production_mcp instead of being invalidated by writes.
+_CACHE_MAX = 512
+_CACHE_TTL = {'brain_recall': 300, 'web_search': 600}  # seconds
+_DISK_CACHE_TTL = 3600  # seconds
+_DISK_CACHE_SIZE = 2 ** 30  # bytes
+
+
+def _tool_call(tool_name: str):
+    """
+    Turn a method returning a tool's data into one returning its MCPExecutionResult
+    
+    The tool's confidence key and phase are resolved once here, so each call
+    only times the body, counts the success and builds the result.
+    """
+    confidence_key = _CONFIDENCE_KEYS[tool_name]
+    phase = _TOOL_PHASES[tool_name]
+    
+    def decorator(method):
+        @functools.wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            start_ns = time.perf_counter_ns()
+            try:
+                data = await method(self, *args, **kwargs)
+            except Exception as e:
+                return self._fail(tool_name, e, start_ns)
+            
+            self._record_success()
+            return MCPExecutionResult(tool_name, True, data, data[confidence_key],
+                                      (time.perf_counter_ns() - start_ns) * 1e-9, phase)
+        return wrapper
+    return decorator
+
+
+def _memoized(tool_name: str, persist: bool = False):
+    """
+    Return repeat calls of a read-only tool method from the interface LRU cache
+    
+    Entries are served for _CACHE_TTL[tool_name] seconds. With persist=True, misses fall through to the on-disk cache (when enabled)
+    before the real call, so results survive process restarts.
+    """
+    ttl = _CACHE_TTL[tool_name]
+    
+    def decorator(method):
+        @functools.wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            key = (tool_name, args, tuple(sorted(kwargs.items())))
+            entry = self._cache.get(key)
+            if entry is not None:
+                stored_at, cached = entry
+                if time.monotonic() - stored_at < ttl:
+                    self._cache.move_to_end(key)
+                    return _cache_hit(cached)
+                del self._cache[key]
+            
+            disk = self._disk_cache if persist else None
+            result = await _to_thread(disk.get, key) if disk is not None else None
+            if result is not None:
+                self._remember(key, result)
+                return _cache_hit(result)
+            
+            result = await method(self, *args, **kwargs)
+            if result.success:
+                self._remember(key, result)
+                if disk is not None:
+                    await _to_thread(functools.partial(disk.set, key, result, expire=_DISK_CACHE_TTL))
+            return result
+        return wrapper
+    return decorator
+
+
+def _cache_hit(result: MCPExecutionResult, **flags) -> MCPExecutionResult:
+    """Copy a cached result for a caller, marking the data as served from cache"""
+    return replace(result, data={**copy.deepcopy(result.data), 'cache_hit': True, **flags}, execution_time=0.0)
+
+
+def _cache_entry(result: MCPExecutionResult) -> MCPExecutionResult:
+    """Copy a result for storage, so the caller's copy can be mutated freely"""
+    return replace(result, data=copy.deepcopy(result.data))
+
+
+async def _to_thread(func, *args):
+    """Run blocking work in the default executor (asyncio.to_thread needs Python 3.9)"""
+    return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+
+def _semantic(method):
+    """Reuse brain_recall results for reworded queries when the semantic cache is enabled"""
+    @functools.wraps(method)
+    async def wrapper(self, query: str, limit: int = 10) -> MCPExecutionResult:
+        if self._semantic_cache is None:
+            return await method(self, query, limit)
+        
+        # Embedding and scoring are CPU-bound; keep them off the event loop thread
+        vector = await _to_thread(self._semantic_cache.encode, query)
+        hit = await _to_thread(self._semantic_cache.lookup, vector)
+        if hit is not None and hit[0] == limit and time.monotonic() - hit[1] < _CACHE_TTL['brain_recall']:
+            cached = hit[2]
+            return _cache_hit(cached, semantic_hit=True)
+        
+        result = await method(self, query, limit)
+        if result.success:
+            self._semantic_cache.store(vector, (limit, time.monotonic(), _cache_entry(result)))
+        return result
+    return wrapper
+
+
+# Case-insensitive topic check without allocating a lowercased copy of the query
+_is_ml_query = re.compile('machine learning', re.IGNORECASE).search
+
+# Static skeletons of the simulated tool responses; {placeholders} are filled per call with str.format
+_RECALL_ML_MEMORIES = (
+    {
+        'key': 'ml_fundamentals',
+        'relevance': 0.89,
+        'content': 'Stored knowledge about {q30}...',
+        'timestamp': '2025-08-03T23:30:00Z'
+    },
+    {
+        'key': 'ai_concepts', 
+        'relevance': 0.76,
+        'content': 'Related concepts for {q30}...',
+        'timestamp': '2025-08-03T22:15:00Z'
+    }
+)
+_RECALL_GENERIC_MEMORIES = (
+    {
+        'key': 'general_knowledge',
+        'relevance': 0.65,
+        'content': 'Basic information about {q30}...',
+        'timestamp': '2025-08-03T20:00:00Z'
+    },
+)
+
+_WEB_SEARCH_RESULTS_SKELETON = (
+    {
+        'url': 'https://en.wikipedia.org/wiki/Machine_learning',
+        'title': '{q20} - Wikipedia',
+        'snippet': 'Comprehensive overview of {q30}...',
+        'relevance': 0.92
+    },
+    {
+        'url': 'https://arxiv.org/search/?query={q_plus}',
+        'title': 'Research papers on {q25}',
+        'snippet': 'Latest academic research on {q30}...',
+        'relevance': 0.87
+    },
+    {
+        'url': 'https://towardsdatascience.com/search?q={q_plus}',
+        'title': 'Practical guide to {q25}',
+        'snippet': 'Applied examples and tutorials for {q30}...',
+        'relevance': 0.81
+    }
+)
+
+_THINKING_MIDDLE_STEPS = (
+    'Breaking down core components',
+    'Identifying key relationships',
+    'Evaluating different approaches',
+    'Synthesizing optimal solution',
+    'Validating reasoning chain'
+)
+
+_VERIFICATION_STEPS = (
+    'Logical consistency analysis',
+    'Evidence quality assessment',
+    'Alternative hypothesis testing',
+    'Assumption validation',
+    'Conclusion strength evaluation'
+)
+_PERSPECTIVES_ANALYZED = (
+    'Technical feasibility perspective',
+    'Theoretical foundation perspective', 
+    'Practical implementation perspective',
+    'Risk assessment perspective'
+)
+_REASONING_RECOMMENDATIONS = (
+    'Validate key assumptions with empirical testing',
+    'Consider alternative implementation approaches',
+    'Develop risk mitigation strategies'
+)
+
 
 class RealMCPToolInterface:
     """
@@ -35,7 +340,19 @@ class RealMCPToolInterface:
     def __init__(self):
         self.execution_count = 0
         self.success_count = 0
-        self.error_log = []
+        self._executions = itertools.count(1)  # next() is one C call, atomic under the GIL
+        self._successes = itertools.count(1)
+        self._error_ring: List[Optional[str]] = [None] * _ERROR_LOG_SIZE
+        self._error_total = 0  # Errors ever logged; the next slot is _error_total & _ERROR_LOG_MASK
+        
+        # Concurrency cap (created on first call, inside the running loop) and circuit breaker state
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._sem: Optional[asyncio.Semaphore] = None
+        self._consecutive_failures: Dict[str, int] = dict.fromkeys(_TOOL_PHASES, 0)  # Per tool, so one failing tool cannot trip the others
+        self._open_until: Dict[str, float] = dict.fromkeys(_TOOL_PHASES, 0.0)
+        self._cache: OrderedDict = OrderedDict()  # (tool, args, kwargs) -> (stored_at, MCPExecutionResult)
+        self._remember_pending: deque = deque()  # (key, value, memory_type, start_ns, future)
+        self._remember_flusher: Optional[asyncio.Task] = None
         
         # Test MCP tool availability
         self._test_mcp_availability()
@@ -55,318 +372,257 @@ class RealMCPToolInterface:
         }
         
         available_count = sum(self.available_tools.values())
-        logger.info(f"✅ {available_count}/5 MCP tools available")
+        logger.info("✅ %d/5 MCP tools available", available_count)
+        
+        # Optional near-match cache for brain_recall; loads an embedding model, so opt-in
+        self._semantic_cache = None
+        if os.getenv("HRM_SEMANTIC_CACHE") == "1":
+            try:
+                from .hrm_semantic_cache import SemanticCache, load_encoder
+                half_life = os.getenv("HRM_SEMANTIC_HALF_LIFE")
+                self._semantic_cache = SemanticCache(load_encoder(),
+                                                     half_life=float(half_life) if half_life else None)
+                logger.info("🧭 Semantic brain_recall cache enabled")
+            except ImportError:
+                logger.warning("HRM_SEMANTIC_CACHE=1 but numpy/sentence-transformers are not installed")
+        
+        # Optional on-disk brain_recall cache shared across runs; opt-in so tests stay hermetic
+        self._disk_cache = None
+        if os.getenv("HRM_DISK_CACHE") == "1":
+            try:
+                import diskcache
+                cache_dir = os.getenv("HRM_DISK_CACHE_DIR", os.path.expanduser("~/.hrm/mcp_cache"))
+                self._disk_cache = diskcache.Cache(cache_dir, size_limit=_DISK_CACHE_SIZE)
+                logger.info("💾 Persistent brain_recall cache at %s", cache_dir)
+            except ImportError:
+                logger.warning("HRM_DISK_CACHE=1 but diskcache is not installed")
+    
+    def _remember(self, key: Tuple, result: MCPExecutionResult):
+        """Insert a result into the in-memory LRU, evicting the oldest entry when full"""
+        self._cache[key] = (time.monotonic(), _cache_entry(result))
+        if len(self._cache) > _CACHE_MAX:
+            self._cache.popitem(last=False)
+    
+    @property
+    def error_log(self) -> List[str]:
+        """Retained errors, oldest first"""
+        return self._recent_errors(_ERROR_LOG_SIZE)
+    
+    def _recent_errors(self, count: int) -> List[str]:
+        """Up to count of the latest errors, oldest first, read by index so writers never invalidate it"""
+        total = self._error_total
+        ring = self._error_ring
+        return [ring[i & _ERROR_LOG_MASK] for i in range(max(0, total - min(count, _ERROR_LOG_SIZE)), total)]
     
+    def _record_success(self):
+        """Advance the execution and success counters"""
+        self.execution_count = next(self._executions)
+        self.success_count = next(self._successes)
+    
+    def _fail(self, tool_name: str, error: Exception, start_ns: int) -> MCPExecutionResult:
+        """Log a tool exception and build the matching failure result"""
+        error_msg = f"{tool_name} failed: {error}"
+        self._error_ring[self._error_total & _ERROR_LOG_MASK] = error_msg
+        self._error_total += 1
+        logger.error(error_msg)
+        return MCPExecutionResult(tool_name, False, None, 0.0, (time.perf_counter_ns() - start_ns) * 1e-9,
+                                  _TOOL_PHASES[tool_name], error_msg)
+    
+    @_memoized('brain_recall', persist=True)
+    @_semantic
+    @_guarded('brain_recall')
+    @_tool_call('brain_recall')
     async def execute_brain_recall(self, query: str, limit: int = 10) -> MCPExecutionResult:
         """Execute real brain_recall MCP tool"""
-        start_time = time.time()
+        logger.info("🧠 Executing brain_recall: %.50s...", query)
         
-        try:
-            logger.info(f"🧠 Executing brain_recall: {query[:50]}...")
-            
-            # PHASE 5: Real MCP tool integration
-            # This would be replaced with actual tool call:
-            # from brain import brain_recall
-            # result = await brain_recall(query=query, limit=limit)
-            
-            # For demonstration, let's simulate what a real integration would look like
-            # but use the available tools in this environment
-            
-            # Simulated realistic result based on actual brain_recall behavior
-            mock_data = {
-                'memories_found': 3 if 'machine learning' in query.lower() else 1,
-                'memories': [
-                    {
-                        'key': 'ml_fundamentals',
-                        'relevance': 0.89,
-                        'content': f'Stored knowledge about {query[:30]}...',
-                        'timestamp': '2025-08-03T23:30:00Z'
-                    },
-                    {
-                        'key': 'ai_concepts', 
-                        'relevance': 0.76,
-                        'content': f'Related concepts for {query[:30]}...',
-                        'timestamp': '2025-08-03T22:15:00Z'
-                    }
-                ] if 'machine learning' in query.lower() else [
-                    {
-                        'key': 'general_knowledge',
-                        'relevance': 0.65,
-                        'content': f'Basic information about {query[:30]}...',
-                        'timestamp': '2025-08-03T20:00:00Z'
-                    }
-                ],
-                'search_confidence': 0.82 if 'machine learning' in query.lower() else 0.45
-            }
-            
-            self.execution_count += 1
-            self.success_count += 1
-            
-            return MCPExecutionResult(
-                tool_name='brain_recall',
-                success=True,
-                data=mock_data,
-                confidence=mock_data['search_confidence'],
-                execution_time=time.time() - start_time,
-                phase=ExecutionPhase.ANALYSIS
-            )
-            
-        except Exception as e:
-            error_msg = f"brain_recall failed: {str(e)}"
-            self.error_log.append(error_msg)
-            logger.error(error_msg)
-            
-            return MCPExecutionResult(
-                tool_name='brain_recall',
-                success=False,
-                data=None,
-                confidence=0.0,
-                execution_time=time.time() - start_time,
-                phase=ExecutionPhase.ANALYSIS,
-                error_message=error_msg
-            )
+        # PHASE 5: Real MCP tool integration
+        # This would be replaced with actual tool call:
+        # from brain import brain_recall
+        # result = await brain_recall(query=query, limit=limit)
+        
+        # For demonstration, let's simulate what a real integration would look like
+        # but use the available tools in this environment
+        
+        # Simulated realistic result based on actual brain_recall behavior
+        is_ml = _is_ml_query(query) is not None
+        q30 = query[:30]
+        mock_data = {
+            'memories_found': 3 if is_ml else 1,
+            'memories': [
+                {**memory, 'content': memory['content'].format(q30=q30)}
+                for memory in (_RECALL_ML_MEMORIES if is_ml else _RECALL_GENERIC_MEMORIES)
+            ],
+            'search_confidence': 0.82 if is_ml else 0.45
+        }
+        
+        return mock_data
     
+    @_memoized('web_search')
+    @_guarded('web_search')
+    @_tool_call('web_search')
     async def execute_web_search(self, query: str) -> MCPExecutionResult:
         """Execute real web_search MCP tool"""
-        start_time = time.time()
+        logger.info("🌐 Executing web_search: %.50s...", query)
         
-        try:
-            logger.info(f"🌐 Executing web_search: {query[:50]}...")
-            
-            # PHASE 5: Real MCP tool integration
-            # This would be replaced with actual tool call:
-            # from web_search import web_search  
-            # result = await web_search(query=query)
-            
-            # Simulated realistic web search result
-            mock_data = {
-                'results_count': 8,
-                'results': [
-                    {
-                        'url': 'https://en.wikipedia.org/wiki/Machine_learning',
-                        'title': f'{query[:20]} - Wikipedia',
-                        'snippet': f'Comprehensive overview of {query[:30]}...',
-                        'relevance': 0.92
-                    },
-                    {
-                        'url': 'https://arxiv.org/search/?query=' + query.replace(' ', '+'),
-                        'title': f'Research papers on {query[:25]}',
-                        'snippet': f'Latest academic research on {query[:30]}...',
-                        'relevance': 0.87
-                    },
-                    {
-                        'url': 'https://towardsdatascience.com/search?q=' + query.replace(' ', '+'),
-                        'title': f'Practical guide to {query[:25]}',
-                        'snippet': f'Applied examples and tutorials for {query[:30]}...',
-                        'relevance': 0.81
-                    }
-                ],
-                'search_confidence': 0.85
-            }
-            
-            self.execution_count += 1
-            self.success_count += 1
-            
-            return MCPExecutionResult(
-                tool_name='web_search',
-                success=True,
-                data=mock_data,
-                confidence=mock_data['search_confidence'],
-                execution_time=time.time() - start_time,
-                phase=ExecutionPhase.ORCHESTRATION
-            )
-            
-        except Exception as e:
-            error_msg = f"web_search failed: {str(e)}"
-            self.error_log.append(error_msg)
-            logger.error(error_msg)
-            
-            return MCPExecutionResult(
-                tool_name='web_search',
-                success=False,
-                data=None,
-                confidence=0.0,
-                execution_time=time.time() - start_time,
-                phase=ExecutionPhase.ORCHESTRATION,
-                error_message=error_msg
-            )
+        # PHASE 5: Real MCP tool integration
+        # This would be replaced with actual tool call:
+        # from web_search import web_search  
+        # result = await web_search(query=query)
+        
+        # Simulated realistic web search result
+        fields = {'q20': query[:20], 'q25': query[:25], 'q30': query[:30], 'q_plus': query.replace(' ', '+')}
+        mock_data = {
+            'results_count': 8,
+            'results': [
+                {
+                    **result,
+                    'url': result['url'].format_map(fields),
+                    'title': result['title'].format_map(fields),
+                    'snippet': result['snippet'].format_map(fields)
+                }
+                for result in _WEB_SEARCH_RESULTS_SKELETON
+            ],
+            'search_confidence': 0.85
+        }
+        
+        return mock_data
     
+    def _bind_loop(self):
+        """Recreate loop-bound state when called from a different event loop than before"""
+        loop = asyncio.get_running_loop()
+        if loop is self._loop:
+            return
+        self._loop = loop
+        self._sem = asyncio.Semaphore(_MAX_CONCURRENCY)
+        # Writes queued on a previous loop can no longer be resolved
+        self._remember_pending.clear()
+        self._remember_flusher = None
+    
+    @_guarded('brain_remember', bounded=False)
     async def execute_brain_remember(self, key: str, value: Any, memory_type: str = "hrm_synthesis") -> MCPExecutionResult:
-        """Execute real brain_remember MCP tool"""
-        start_time = time.time()
+        """Execute real brain_remember MCP tool, coalesced with concurrent writes"""
+        future = asyncio.get_running_loop().create_future()
+        self._remember_pending.append((key, value, memory_type, time.perf_counter_ns(), future))
+        if self._remember_flusher is None or self._remember_flusher.done():
+            self._remember_flusher = asyncio.ensure_future(self._flush_remembers())
+        return await future
+    
+    async def _flush_remembers(self):
+        """Drain queued brain_remember writes in batches until the queue is empty"""
+        while self._remember_pending:
+            # Yield at least once so writes issued in the same tick join this batch
+            await asyncio.sleep(_REMEMBER_WINDOW)
+            
+            pending = self._remember_pending
+            batch = [pending.popleft() for _ in range(min(len(pending), _REMEMBER_BATCH_MAX))]
+            results = error = None
+            try:
+                # Writers wait on their futures without a slot; the batch round trip takes one
+                async with self._sem:
+                    results = self._store_memories(batch)
+            except Exception as e:
+                error = e
+                logger.error("brain_remember batch of %d failed: %s", len(batch), e)
+            finally:
+                # Every queued writer is resolved, even if this task is cancelled
+                for index, (*_, future) in enumerate(batch):
+                    if future.done():
+                        continue
+                    if error is not None:
+                        future.set_exception(error)
+                    elif results is None:
+                        future.cancel()
+                    else:
+                        future.set_result(results[index])
+    
+    def _store_memories(self, batch: List[Tuple]) -> List[MCPExecutionResult]:
+        """Write a batch of memories in one brain_remember round trip"""
+        logger.info("💾 Executing brain_remember: %d key(s)", len(batch))
         
-        try:
-            logger.info(f"💾 Executing brain_remember: {key}")
-            
-            # PHASE 5: Real MCP tool integration
-            # This would be replaced with actual tool call:
-            # from brain import brain_remember
-            # result = await brain_remember(key=key, value=value, type=memory_type)
-            
-            # Simulated realistic storage result
-            mock_data = {
-                'stored': True,
-                'key': key,
-                'memory_type': memory_type,
-                'content_length': len(str(value)),
-                'storage_confidence': 0.96,
-                'stored_at': '2025-08-04T04:35:00Z'
-            }
-            
-            self.execution_count += 1
-            self.success_count += 1
-            
-            return MCPExecutionResult(
-                tool_name='brain_remember',
-                success=True,
-                data=mock_data,
-                confidence=mock_data['storage_confidence'],
-                execution_time=time.time() - start_time,
-                phase=ExecutionPhase.SYNTHESIS
-            )
-            
-        except Exception as e:
-            error_msg = f"brain_remember failed: {str(e)}"
-            self.error_log.append(error_msg)
-            logger.error(error_msg)
-            
-            return MCPExecutionResult(
-                tool_name='brain_remember',
-                success=False,
-                data=None,
-                confidence=0.0,
-                execution_time=time.time() - start_time,
-                phase=ExecutionPhase.SYNTHESIS,
-                error_message=error_msg
-            )
+        # PHASE 5: Real MCP tool integration
+        # This would be replaced with one batched tool call, or a loop where batching is unsupported:
+        # from brain import brain_remember
+        # result = await brain_remember(key=key, value=value, type=memory_type)
+        
+        results = []
+        for key, value, memory_type, start_ns, _ in batch:
+            try:
+                # Simulated realistic storage result
+                mock_data = {
+                    'stored': True,
+                    'key': key,
+                    'memory_type': memory_type,
+                    'content_length': len(str(value)),
+                    'storage_confidence': 0.96,
+                    'stored_at': _now_iso()
+                }
+                
+                self._record_success()
+                
+                results.append(_ok('brain_remember', mock_data, start_ns))
+                
+            except Exception as e:
+                results.append(self._fail('brain_remember', e, start_ns))
+        return results
     
+    @_guarded('sequential_thinking')
+    @_tool_call('sequential_thinking')
     async def execute_sequential_thinking(self, thought: str, problem_type: str = "analysis") -> MCPExecutionResult:
         """Execute real sequential_thinking MCP tool"""
-        start_time = time.time()
+        logger.info("🤔 Executing sequential_thinking: %.50s...", thought)
         
-        try:
-            logger.info(f"🤔 Executing sequential_thinking: {thought[:50]}...")
-            
-            # PHASE 5: Real MCP tool integration
-            # This would be replaced with actual tool call:
-            # from sequential_thinking import sequential_thinking
-            # result = await sequential_thinking(thought=thought, problem_type=problem_type)
-            
-            # Simulated realistic sequential thinking result
-            mock_data = {
-                'thoughts_generated': 7,
-                'reasoning_chain': [
-                    f'Initial analysis of {thought[:20]}',
-                    'Breaking down core components',
-                    'Identifying key relationships',
-                    'Evaluating different approaches',
-                    'Synthesizing optimal solution',
-                    'Validating reasoning chain',
-                    f'Final conclusions for {thought[:20]}'
-                ],
-                'final_answer': f'Sequential analysis reveals that {thought[:40]} requires multi-step approach with careful consideration of interdependencies.',
-                'thinking_confidence': 0.83
-            }
-            
-            self.execution_count += 1
-            self.success_count += 1
-            
-            return MCPExecutionResult(
-                tool_name='sequential_thinking',
-                success=True,
-                data=mock_data,
-                confidence=mock_data['thinking_confidence'],
-                execution_time=time.time() - start_time,
-                phase=ExecutionPhase.ORCHESTRATION
-            )
-            
-        except Exception as e:
-            error_msg = f"sequential_thinking failed: {str(e)}"
-            self.error_log.append(error_msg)
-            logger.error(error_msg)
-            
-            return MCPExecutionResult(
-                tool_name='sequential_thinking',
-                success=False,
-                data=None,
-                confidence=0.0,
-                execution_time=time.time() - start_time,
-                phase=ExecutionPhase.ORCHESTRATION,
-                error_message=error_msg
-            )
+        # PHASE 5: Real MCP tool integration
+        # This would be replaced with actual tool call:
+        # from sequential_thinking import sequential_thinking
+        # result = await sequential_thinking(thought=thought, problem_type=problem_type)
+        
+        # Simulated realistic sequential thinking result
+        t20 = thought[:20]
+        mock_data = {
+            'thoughts_generated': 7,
+            'reasoning_chain': [
+                f'Initial analysis of {t20}',
+                *_THINKING_MIDDLE_STEPS,
+                f'Final conclusions for {t20}'
+            ],
+            'final_answer': f'Sequential analysis reveals that {thought[:40]} requires multi-step approach with careful consideration of interdependencies.',
+            'thinking_confidence': 0.83
+        }
+        
+        return mock_data
     
+    @_guarded('reasoning_tools')
+    @_tool_call('reasoning_tools')
     async def execute_reasoning_tools(self, problem: str, problem_type: str = "systematic") -> MCPExecutionResult:
         """Execute real reasoning_tools MCP tool"""
-        start_time = time.time()
+        logger.info("⚡ Executing reasoning_tools: %.50s...", problem)
         
-        try:
-            logger.info(f"⚡ Executing reasoning_tools: {problem[:50]}...")
-            
-            # PHASE 5: Real MCP tool integration
-            # This would be replaced with actual tool call:
-            # from reasoning_tools import reasoning_tools
-            # result = await reasoning_tools.systematic_verify(problem=problem, problem_type=problem_type)
-            
-            # Simulated realistic reasoning tools result
-            mock_data = {
-                'analysis_complete': True,
-                'verification_steps': [
-                    'Logical consistency analysis',
-                    'Evidence quality assessment',
-                    'Alternative hypothesis testing',
-                    'Assumption validation',
-                    'Conclusion strength evaluation'
-                ],
-                'perspectives_analyzed': [
-                    'Technical feasibility perspective',
-                    'Theoretical foundation perspective', 
-                    'Practical implementation perspective',
-                    'Risk assessment perspective'
-                ],
-                'verification_result': f'Systematic analysis of {problem[:30]} shows strong logical consistency with moderate implementation complexity.',
-                'final_confidence': 0.79,
-                'recommendations': [
-                    'Validate key assumptions with empirical testing',
-                    'Consider alternative implementation approaches',
-                    'Develop risk mitigation strategies'
-                ]
-            }
-            
-            self.execution_count += 1
-            self.success_count += 1
-            
-            return MCPExecutionResult(
-                tool_name='reasoning_tools',
-                success=True,
-                data=mock_data,
-                confidence=mock_data['final_confidence'],
-                execution_time=time.time() - start_time,
-                phase=ExecutionPhase.CONVERGENCE
-            )
-            
-        except Exception as e:
-            error_msg = f"reasoning_tools failed: {str(e)}"
-            self.error_log.append(error_msg)
-            logger.error(error_msg)
-            
-            return MCPExecutionResult(
-                tool_name='reasoning_tools',
-                success=False,
-                data=None,
-                confidence=0.0,
-                execution_time=time.time() - start_time,
-                phase=ExecutionPhase.CONVERGENCE,
-                error_message=error_msg
-            )
+        # PHASE 5: Real MCP tool integration
+        # This would be replaced with actual tool call:
+        # from reasoning_tools import reasoning_tools
+        # result = await reasoning_tools.systematic_verify(problem=problem, problem_type=problem_type)
+        
+        # Simulated realistic reasoning tools result
+        mock_data = {
+            'analysis_complete': True,
+            'verification_steps': list(_VERIFICATION_STEPS),
+            'perspectives_analyzed': list(_PERSPECTIVES_ANALYZED),
+            'verification_result': f'Systematic analysis of {problem[:30]} shows strong logical consistency with moderate implementation complexity.',
+            'final_confidence': 0.79,
+            'recommendations': list(_REASONING_RECOMMENDATIONS)
+        }
+        
+        return mock_data
     
     def get_stats(self) -> Dict[str, Any]:
         """Get interface execution statistics"""
         return {
             'total_executions': self.execution_count,
             'success_count': self.success_count,
-            'success_rate': self.success_count / max(self.execution_count, 1),
-            'error_count': len(self.error_log),
-            'recent_errors': self.error_log[-5:] if self.error_log else [],
+            'success_rate': self.success_count / self.execution_count if self.execution_count else 0.0,
+            'error_count': self._error_total,
+            'recent_errors': self._recent_errors(5),
             'available_tools': self.available_tools,
             'integration_status': '🚀 Real MCP Integration Ready'
         }
@@ -391,6 +647,21 @@ class ProductionMCPIntegration:
             from .hrm_automation_engine import MCPToolInterface
             self.tool_interface = MCPToolInterface()
             logger.info("⚠️ Production MCP Integration: Mock tools fallback")
+        
+        # Tool name -> (bound interface method, positional parameter names, defaults)
+        interface = self.tool_interface
+        self._dispatch = {
+            'brain_recall': (interface.execute_brain_recall, ('query', 'limit'), {'limit': 10}),
+            'web_search': (interface.execute_web_search, ('query',), {}),
+            'brain_remember': (interface.execute_brain_remember, ('key', 'value', 'memory_type'), {'memory_type': 'hrm_synthesis'}),
+            'sequential_thinking': (interface.execute_sequential_thinking, ('thought', 'problem_type'), {'problem_type': 'analysis'}),
+            'reasoning_tools': (interface.execute_reasoning_tools, ('problem', 'problem_type'), {'problem_type': 'systematic'})
+        }
+        
+        # Status is rebuilt only after a tool result has been recorded
+        self._generation = 0
+        self._status_generation = -1
+        self._status_cache = None
     
     async def execute_tool(self, tool_name: str, **kwargs) -> MCPExecutionResult:
         """
@@ -403,56 +674,108 @@ class ProductionMCPIntegration:
         Returns:
             MCPExecutionResult with real tool data
         """
-        # Route to appropriate tool method
-        if tool_name == 'brain_recall':
-            return await self.tool_interface.execute_brain_recall(
-                kwargs.get('query', ''),
-                kwargs.get('limit', 10)
-            )
-        elif tool_name == 'web_search':
-            return await self.tool_interface.execute_web_search(
-                kwargs.get('query', '')
-            )
-        elif tool_name == 'brain_remember':
-            return await self.tool_interface.execute_brain_remember(
-                kwargs.get('key', ''),
-                kwargs.get('value', ''),
-                kwargs.get('memory_type', 'hrm_synthesis')
-            )
-        elif tool_name == 'sequential_thinking':
-            return await self.tool_interface.execute_sequential_thinking(
-                kwargs.get('thought', ''),
-                kwargs.get('problem_type', 'analysis')
-            )
-        elif tool_name == 'reasoning_tools':
-            return await self.tool_interface.execute_reasoning_tools(
-                kwargs.get('problem', ''),
-                kwargs.get('problem_type', 'systematic')
-            )
-        else:
+        try:
+            return await self._dispatch_tool(tool_name, **kwargs)
+        finally:
+            self._generation += 1
+    
+    async def _dispatch_tool(self, tool_name: str, **kwargs) -> MCPExecutionResult:
+        """Route a tool call to the matching interface method"""
+        entry = self._dispatch.get(tool_name)
+        if entry is None:
             # Unknown tool - fallback to brain_recall
-            logger.warning(f"Unknown tool {tool_name}, falling back to brain_recall")
+            logger.warning("Unknown tool %s, falling back to brain_recall", tool_name)
             return await self.tool_interface.execute_brain_recall(
                 kwargs.get('query', str(kwargs))
             )
+        
+        method, params, defaults = entry
+        return await method(*[kwargs.get(name, defaults.get(name, '')) for name in params])
+    
+    async def execute_tools_parallel(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[MCPExecutionResult]:
+        """
+        Execute independent tool calls concurrently
+        
+        Args:
+            calls: (tool_name, kwargs) pairs with no dependencies between them
+            
+        Returns:
+            MCPExecutionResult per call, in the same order as calls
+        """
+        outcomes = await asyncio.gather(*(self.execute_tool(name, **kwargs) for name, kwargs in calls),
+                                        return_exceptions=True)
+        
+        results = []
+        for (tool_name, _), outcome in zip(calls, outcomes):
+            if isinstance(outcome, BaseException):
+                error_msg = f"{tool_name} failed: {str(outcome)}"
+                logger.error(error_msg)
+                outcome = MCPExecutionResult(
+                    tool_name=tool_name,
+                    success=False,
+                    data=None,
+                    confidence=0.0,
+                    execution_time=0.0,
+                    phase=_TOOL_PHASES.get(tool_name, ExecutionPhase.ORCHESTRATION),
+                    error_message=error_msg
+                )
+            results.append(outcome)
+        return results
     
     def get_integration_status(self) -> Dict[str, Any]:
-        """Get production integration status"""
-        stats = self.tool_interface.get_stats()
+        """
+        Get production integration status
         
-        return {
-            'integration_type': 'Real MCP Tools' if self.use_real_tools else 'Mock Tools',
-            'tool_stats': stats,
-            'production_ready': self.use_real_tools,
-            'phase': '5 - Real-World Integration'
-        }
+        The result is cached until the next execute_tool call, so repeated
+        polling between tool executions does not rebuild the stats.
+        """
+        if self._status_generation != self._generation:
+            self._status_cache = {
+                'integration_type': 'Real MCP Tools' if self.use_real_tools else 'Mock Tools',
+                'tool_stats': self.tool_interface.get_stats(),
+                'production_ready': self.use_real_tools,
+                'phase': '5 - Real-World Integration'
+            }
+            self._status_generation = self._generation
+        
+        return self._status_cache
+
+
+def enable_background_logging() -> logging.handlers.QueueListener:
+    """
+    Move the root logger's handlers onto a background thread
+    
+    Log records are queued from the event loop and written by a
+    QueueListener, so coroutines never block on stream or file I/O.
+    Opt-in because it reconfigures the application's root logger. With no
+    root handlers configured, warnings and errors go to stderr as before.
+    
+    Returns:
+        The started listener; call stop() to flush and detach it
+    """
+    root = logging.getLogger()
+    handlers = root.handlers
+    if not handlers:
+        # The QueueHandler would hide logging.lastResort, so install its equivalent
+        fallback = logging.StreamHandler()
+        fallback.setLevel(logging.WARNING)
+        handlers = [fallback]
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    root.handlers = [logging.handlers.QueueHandler(log_queue)]
+    listener.start()
+    return listener
 
 
 # Example usage and testing
 async def test_real_mcp_integration():
     """Test the real MCP integration"""
-    print("🧪 Testing Real MCP Integration - Phase 5")
-    print("=" * 50)
+    # Report lines are buffered and written once so stdout never blocks between awaits
+    out = []
+    emit = out.append
+    
+    emit("🧪 Testing Real MCP Integration - Phase 5")
+    emit("=" * 50)
     
     # Initialize production integration
     integration = ProductionMCPIntegration(use_real_tools=True)
@@ -466,27 +789,37 @@ async def test_real_mcp_integration():
         ('brain_remember', {'key': 'test_synthesis', 'value': 'HRM integration test results'})
     ]
     
-    for tool_name, params in test_cases:
-        print(f"\n🔧 Testing {tool_name}")
+    # Independent calls run concurrently within a phase; phases run in order
+    for phase in ExecutionPhase:
+        batch = [(name, params) for name, params in test_cases if _TOOL_PHASES.get(name) is phase]
+        if not batch:
+            continue
         
-        result = await integration.execute_tool(tool_name, **params)
+        results = await integration.execute_tools_parallel(batch)
         
-        status = "✅" if result.success else "❌"
-        print(f"  {status} Success: {result.success}")
-        print(f"  Confidence: {result.confidence:.2f}")
-        print(f"  Time: {result.execution_time:.2f}s")
-        if result.error_message:
-            print(f"  Error: {result.error_message}")
+        for (tool_name, _), result in zip(batch, results):
+            emit(f"\n🔧 Testing {tool_name} ({phase.name})")
+            status = "✅" if result.success else "❌"
+            emit(f"  {status} Success: {result.success}")
+            emit(f"  Confidence: {result.confidence:.2f}")
+            emit(f"  Time: {result.execution_time:.2f}s")
+            if result.error_message:
+                emit(f"  Error: {result.error_message}")
     
     # Integration status
     status = integration.get_integration_status()
-    print(f"\n📊 Integration Status:")
-    print(f"  Type: {status['integration_type']}")
-    print(f"  Production Ready: {status['production_ready']}")
-    print(f"  Success Rate: {status['tool_stats']['success_rate']:.1%}")
+    emit(f"\n📊 Integration Status:")
+    emit(f"  Type: {status['integration_type']}")
+    emit(f"  Production Ready: {status['production_ready']}")
+    emit(f"  Success Rate: {status['tool_stats']['success_rate']:.1%}")
     
-    print(f"\n✅ Real MCP Integration testing complete!")
+    emit(f"\n✅ Real MCP Integration testing complete!")
+    print("\n".join(out), flush=True)
 
 
 if __name__ == "__main__":
-    asyncio.run(test_real_mcp_integration())
+    listener = enable_background_logging()
+    try:
+        asyncio.run(test_real_mcp_integration())
+    finally:
+        listener.stop()
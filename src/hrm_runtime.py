@@ -0,0 +1,29 @@
+"""
+HRM Script Runtime Setup
+========================
+
+Event loop setup shared by the demo and test entry points. Kept free of
+package imports so scripts that put src/ on sys.path can import it too.
+
+Author: HRM Phase 6 Team
+Date: August 2025
+Phase: 6.2 - Real MCP Integration
+"""
+
+
+def install_uvloop() -> bool:
+    """
+    Make uvloop the event loop policy when it is installed
+
+    Call before asyncio.run(). uvloop is optional (``pip install .[perf]``);
+    without it the default event loop is used.
+
+    Returns:
+        True if uvloop was installed
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    uvloop.install()
+    return True
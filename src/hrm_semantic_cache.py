@@ -0,0 +1,106 @@
+"""
+HRM Semantic Cache: Near-Match Reuse of Recall Results
+=====================================================
+
+Exact-match caches miss queries that differ only in wording. This cache
+embeds each query and returns a stored value when the cosine similarity
+to an earlier query clears a threshold.
+
+Requires numpy and sentence-transformers (``pip install .[semantic]``);
+hrm_real_mcp only imports this module when HRM_SEMANTIC_CACHE=1.
+
+Author: HRM Implementation Team
+Date: August 2025
+Phase: 5 - Real-World Integration
+"""
+
+import functools
+import threading
+import time
+from typing import Any, List, Optional
+
+import numpy as np
+
+from .hrm_real_mcp_kernels import score_recall
+
+# Key matrix grows in blocks of rows instead of one vstack per insert
+_BLOCK_ROWS = 256
+
+
+@functools.lru_cache(maxsize=None)
+def load_encoder(model_name: str = "all-MiniLM-L6-v2"):
+    """Load a sentence encoder once per process"""
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer(model_name)
+
+
+class SemanticCache:
+    """
+    Cosine-similarity cache over unit-normalized query embeddings
+
+    Keys live in one preallocated [capacity, dim] matrix so a lookup is a
+    single matrix-vector product. Once max_entries is reached, the oldest
+    entry is overwritten. With a half_life, similarities decay with entry
+    age so stale near-matches stop being served. Lookups run on executor
+    threads, so reads and writes of a row are serialized by a lock.
+    """
+
+    def __init__(self, encoder: Any, threshold: float = 0.92, max_entries: int = 1024,
+                 half_life: Optional[float] = None):
+        self.encoder = encoder
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.half_life = half_life
+        self._keys: Optional[np.ndarray] = None
+        self._stored_at = np.zeros(max_entries, dtype=np.float64)
+        self._values: List[Any] = []
+        self._oldest = 0  # Row overwritten next once the cache is full
+        self._lock = threading.Lock()
+
+    def encode(self, text: str) -> np.ndarray:
+        """Embed text as a unit vector"""
+        vector = np.asarray(self.encoder.encode(text), dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def lookup(self, vector: np.ndarray) -> Optional[Any]:
+        """Return the value of the most similar stored key, or None below the threshold"""
+        with self._lock:
+            if not self._values:
+                return None
+
+            count = len(self._values)
+            similarities = self._keys[:count] @ vector
+            if self.half_life is None:
+                best = int(np.argmax(similarities))
+                score = similarities[best]
+            else:
+                ages = time.monotonic() - self._stored_at[:count]
+                score, best = score_recall(similarities, ages, self.half_life)
+            return self._values[best] if score >= self.threshold else None
+
+    def clear(self):
+        """Drop every entry, keeping the allocated key matrix for reuse"""
+        with self._lock:
+            self._values.clear()
+            self._oldest = 0
+
+    def store(self, vector: np.ndarray, value: Any):
+        """Add an embedded key and its value, evicting the oldest entry when full"""
+        with self._lock:
+            count = len(self._values)
+            if self._keys is None:
+                self._keys = np.zeros((min(_BLOCK_ROWS, self.max_entries), vector.shape[0]), dtype=np.float32)
+
+            if count < self.max_entries:
+                if count == self._keys.shape[0]:
+                    rows = min(_BLOCK_ROWS, self.max_entries - count)
+                    self._keys = np.vstack([self._keys, np.zeros((rows, self._keys.shape[1]), dtype=np.float32)])
+                self._keys[count] = vector
+                self._stored_at[count] = time.monotonic()
+                self._values.append(value)
+            else:
+                self._keys[self._oldest] = vector
+                self._stored_at[self._oldest] = time.monotonic()
+                self._values[self._oldest] = value
+                self._oldest = (self._oldest + 1) % self.max_entries
@@ -10,10 +10,74 @@ Date: August 2025
 Platform: Claude App + MCP on Mac Mini
 """
 
-from typing import Dict, Any, Optional, List
+from typing import AsyncIterator, Callable, Dict, Any, Optional, List, Tuple
+import time
 import asyncio
+import copy
+import inspect
+from array import array
 import json
-from dataclasses import dataclass
+import sys
+from collections import OrderedDict
+from contextlib import AsyncExitStack
+from dataclasses import dataclass, replace
+from types import MappingProxyType
+
+from .hrm_json import canonical_dumps
+from .hrm_preview import format_data_preview
+from .hrm_runtime import install_uvloop
+
+
+# Retrieval tools only read memory or the web, so a contiguous run of them can share one context
+_PARALLEL_TOOLS = frozenset({'brain_recall', 'web_search'})
+_MAX_CONCURRENT = 8
+
+# Steps that still run after streaming execution stops early, so the synthesis is stored
+_STORAGE_TOOLS = frozenset({'brain_remember'})
+_BATCH_TIMEOUT_MS = 10000
+
+# Tools whose result depends only on their parameters; brain_remember writes, so it is never cached
+_CACHEABLE_TOOLS = frozenset({'brain_recall', 'web_search', 'sequential_thinking', 'reasoning_tools'})
+_RESULT_CACHE_SIZE = 512
+
+# Raw execution entries kept for debugging, in a power-of-two ring of typed columns;
+# stats are aggregated as calls complete
+_EXECUTION_LOG_SIZE = 1024
+_EXECUTION_LOG_MASK = _EXECUTION_LOG_SIZE - 1
+
+
+# Static tool manifest shared by every orchestrator: name -> description, hierarchy level, mock method
+_TOOL_REGISTRY = MappingProxyType({
+    'brain_recall': MappingProxyType({
+        'description': 'Retrieve information from brain memory',
+        'level': 'HIGH',
+        'method': '_brain_recall'
+    }),
+    'web_search': MappingProxyType({
+        'description': 'Search the web for current information',
+        'level': 'LOW',
+        'method': '_web_search'
+    }),
+    'brain_remember': MappingProxyType({
+        'description': 'Store synthesized knowledge in brain memory',
+        'level': 'HIGH',
+        'method': '_brain_remember'
+    }),
+    'sequential_thinking': MappingProxyType({
+        'description': 'Step-by-step problem decomposition',
+        'level': 'LOW',
+        'method': '_sequential_thinking'
+    }),
+    'reasoning_tools': MappingProxyType({
+        'description': 'Multi-perspective systematic analysis',
+        'level': 'LOW',
+        'method': '_reasoning_tools'
+    })
+})
+
+
+def _default_params(context: str, log_length: int) -> Dict[str, Any]:
+    return {'query': context}
 
 
 @dataclass
@@ -25,6 +89,48 @@ class MCPToolResult:
     confidence: float
     execution_time: float
     error_message: Optional[str] = None
+    
+    @property
+    def preview(self) -> Optional[str]:
+        """Short, size-bounded preview of the data, built only when asked for"""
+        return format_data_preview(self.data)
+
+
+def _cancelled_result(tool_name: str) -> MCPToolResult:
+    """Result reported for a pattern step that was cancelled or never started"""
+    return MCPToolResult(
+        tool_name=tool_name,
+        success=False,
+        data=None,
+        confidence=0.0,
+        execution_time=0.0,
+        error_message='cancelled'
+    )
+
+
+class _ChainContext:
+    """Chain-reasoning context kept as segments and joined only when a step reads it"""
+    
+    __slots__ = ('_parts', '_text')
+    
+    def __init__(self, query: str):
+        self._parts = [query]
+        self._text: Optional[str] = query
+    
+    def add(self, result: MCPToolResult):
+        """Append a successful result for the next tool"""
+        if result.success and result.data:
+            if isinstance(result.data, dict) and 'data' in result.data:
+                self._parts.append(str(result.data['data']))
+            else:
+                self._parts.append(str(result.data)[:100])
+            self._text = None
+    
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = ' | '.join(self._parts)
+        return self._text
 
 
 class MCPToolOrchestrator:
@@ -33,39 +139,67 @@ class MCPToolOrchestrator:
     
     This class handles the actual integration with Claude's MCP tools.
     Currently implements the interface - actual tool calls would be made here.
+    Tool functions may be plain or async; the mocks are plain so a call does
+    not pay for a coroutine it never suspends.
     """
     
-    def __init__(self):
-        self.available_tools = {
-            'brain_recall': {
-                'description': 'Retrieve information from brain memory',
-                'level': 'HIGH',
-                'function': self._brain_recall
-            },
-            'web_search': {
-                'description': 'Search the web for current information', 
-                'level': 'LOW',
-                'function': self._web_search
-            },
-            'brain_remember': {
-                'description': 'Store synthesized knowledge in brain memory',
-                'level': 'HIGH', 
-                'function': self._brain_remember
-            },
-            'sequential_thinking': {
-                'description': 'Step-by-step problem decomposition',
-                'level': 'LOW',
-                'function': self._sequential_thinking
-            },
-            'reasoning_tools': {
-                'description': 'Multi-perspective systematic analysis',
-                'level': 'LOW',
-                'function': self._reasoning_tools
-            }
+    # Tool-specific parameter builders: (context, execution log length) -> params
+    _PARAM_BUILDERS: Dict[str, Callable[[str, int], Dict[str, Any]]] = {
+        'brain_recall': lambda ctx, n: {'query': ctx},
+        'web_search': lambda ctx, n: {'query': ctx},
+        'brain_remember': lambda ctx, n: {'key': f"hrm_brain_remember_{n}", 'content': f"HRM synthesis: {ctx}"},
+        'sequential_thinking': lambda ctx, n: {'problem': ctx},
+        'reasoning_tools': lambda ctx, n: {'problem': ctx},
+    }
+    
+    def __init__(self, servers: Optional[Dict[str, Dict[str, Any]]] = None, batch_server: Optional[str] = None,
+                 cache_ttl_seconds: float = 300.0):
+        """
+        Args:
+            servers: Optional MCP stdio servers by name, as StdioServerParameters
+                keyword arguments (command, args, env). Each server gets one
+                session, opened on first use and shared by every later call.
+            batch_server: Optional name of a server exposing a BatchIt-style
+                batch_execute tool; concurrent pattern steps then go out as
+                one aggregated call instead of one call per tool.
+            cache_ttl_seconds: How long a server's tool manifest is reused
+                before list_server_tools() asks the server again.
+        """
+        self.available_tools = MappingProxyType({
+            name: {'description': meta['description'], 'level': meta['level'], 'function': getattr(self, meta['method'])}
+            for name, meta in _TOOL_REGISTRY.items()
+        })
+        # Flat name -> function table for dispatch; interned keys compare by identity first
+        self._tool_funcs: Dict[str, Callable] = {
+            sys.intern(name): tool['function'] for name, tool in self.available_tools.items()
         }
-        self.execution_log = []
+        self._tool_names = list(self.available_tools)
+        self._tool_ids = {name: i for i, name in enumerate(self._tool_names)}
+        
+        # Execution log as one column per field; slot = execution number & _EXECUTION_LOG_MASK
+        self._log_tool = array('B', bytes(_EXECUTION_LOG_SIZE))
+        self._log_success = array('B', bytes(_EXECUTION_LOG_SIZE))
+        self._log_confidence = array('d', bytes(8 * _EXECUTION_LOG_SIZE))
+        self._log_time = array('d', bytes(8 * _EXECUTION_LOG_SIZE))
+        self._log_timestamp = array('d', bytes(8 * _EXECUTION_LOG_SIZE))
+        self._tool_totals: Dict[str, Dict[str, Any]] = {}  # tool -> count, confidence_sum, time_sum
+        self._total_executions = 0
+        self._total_successes = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None  # Created on first use, inside the running loop
+        
+        # Live MCP sessions, owned by one exit stack so aclose() tears them all down
+        self.servers = servers or {}
+        self.batch_server = batch_server
+        self._exit_stack = AsyncExitStack()
+        self._sessions: Dict[str, Any] = {}
+        self._session_lock: Optional[asyncio.Lock] = None
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self._server_tools: Dict[str, Tuple[float, Any]] = {}  # server -> (expiry, manifest)
+        self._result_cache: OrderedDict = OrderedDict()  # (tool, canonical kwargs JSON) -> MCPToolResult
+        self._cache_stats = {'hits': 0, 'misses': 0}
     
-    async def _brain_recall(self, query: str, **kwargs) -> MCPToolResult:
+    def _brain_recall(self, query: str, **kwargs) -> MCPToolResult:
         """
         Execute brain_recall MCP tool
         
@@ -90,7 +224,7 @@ class MCPToolOrchestrator:
             execution_time=1.2
         )
     
-    async def _web_search(self, query: str, **kwargs) -> MCPToolResult:
+    def _web_search(self, query: str, **kwargs) -> MCPToolResult:
         """
         Execute web_search MCP tool
         
@@ -113,7 +247,7 @@ class MCPToolOrchestrator:
             execution_time=3.4
         )
     
-    async def _brain_remember(self, key: str, content: str, **kwargs) -> MCPToolResult:
+    def _brain_remember(self, key: str, content: str, **kwargs) -> MCPToolResult:
         """
         Execute brain_remember MCP tool
         
@@ -136,7 +270,7 @@ class MCPToolOrchestrator:
             execution_time=0.8
         )
     
-    async def _sequential_thinking(self, problem: str, **kwargs) -> MCPToolResult:
+    def _sequential_thinking(self, problem: str, **kwargs) -> MCPToolResult:
         """
         Execute sequential_thinking MCP tool
         
@@ -164,7 +298,7 @@ class MCPToolOrchestrator:
             execution_time=2.1
         )
     
-    async def _reasoning_tools(self, problem: str, **kwargs) -> MCPToolResult:
+    def _reasoning_tools(self, problem: str, **kwargs) -> MCPToolResult:
         """
         Execute reasoning_tools MCP tool
         
@@ -192,6 +326,72 @@ class MCPToolOrchestrator:
             execution_time=4.2
         )
     
+    def _bind_loop(self):
+        """Recreate the loop-bound primitives and drop sessions opened on a previous event loop"""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            if self._sessions:
+                # Their transports belong to the old loop; reconnect on next use
+                self._sessions = {}
+                self._exit_stack = AsyncExitStack()
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(_MAX_CONCURRENT)
+            self._session_lock = asyncio.Lock()
+    
+    async def _ensure_session(self, server: str):
+        """Return the shared session of an MCP server, connecting on first use"""
+        self._bind_loop()
+        session = self._sessions.get(server)
+        if session is not None:
+            return session
+        
+        async with self._session_lock:
+            if server not in self._sessions:
+                # Imported here: the MCP SDK is only needed once real servers are configured
+                from mcp import ClientSession, StdioServerParameters
+                from mcp.client.stdio import stdio_client
+                
+                read, write = await self._exit_stack.enter_async_context(
+                    stdio_client(StdioServerParameters(**self.servers[server]))
+                )
+                session = await self._exit_stack.enter_async_context(ClientSession(read, write))
+                await session.initialize()
+                self._sessions[server] = session
+        return self._sessions[server]
+    
+    async def call_server_tool(self, server: str, name: str, arguments: Dict[str, Any]) -> Any:
+        """
+        Call a tool on a configured MCP server over its shared session
+        
+        In real implementation, the tool functions above would call e.g.:
+        await self.call_server_tool('brain', 'brain_recall', {'query': query})
+        """
+        session = await self._ensure_session(server)
+        return await session.call_tool(name, arguments)
+    
+    async def list_server_tools(self, server: str) -> Any:
+        """Return a server's tool manifest, refetched at most once per cache_ttl_seconds"""
+        cached = self._server_tools.get(server)
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+        
+        session = await self._ensure_session(server)
+        manifest = await session.list_tools()
+        self._server_tools[server] = (time.monotonic() + self.cache_ttl_seconds, manifest)
+        return manifest
+    
+    def invalidate_tools(self, server: Optional[str] = None):
+        """Drop cached tool manifests, for one server or all of them"""
+        if server is None:
+            self._server_tools.clear()
+        else:
+            self._server_tools.pop(server, None)
+    
+    async def aclose(self):
+        """Close every open MCP session"""
+        await self._exit_stack.aclose()
+        self._sessions.clear()
+    
     async def execute_tool(self, tool_name: str, **kwargs) -> MCPToolResult:
         """
         Execute a specific MCP tool
@@ -203,7 +403,8 @@ class MCPToolOrchestrator:
         Returns:
             MCPToolResult with execution details
         """
-        if tool_name not in self.available_tools:
+        tool_function = self._tool_funcs.get(tool_name)
+        if tool_function is None:
             return MCPToolResult(
                 tool_name=tool_name,
                 success=False,
@@ -213,19 +414,34 @@ class MCPToolOrchestrator:
                 error_message=f"Tool '{tool_name}' not available"
             )
         
+        # Callers can opt a single call out of the cache with _meta={'cache_hint': 'no-cache'}
+        meta = kwargs.pop('_meta', None) or {}
+        cache_key = None
+        
         try:
-            tool_function = self.available_tools[tool_name]['function']
-            result = await tool_function(**kwargs)
+            if tool_name in _CACHEABLE_TOOLS and meta.get('cache_hint') != 'no-cache':
+                cache_key = (tool_name, canonical_dumps(kwargs))
+                cached = self._result_cache.get(cache_key)
+                if cached is not None:
+                    self._result_cache.move_to_end(cache_key)
+                    # Hits are counted in the cache stats only; folding them into the
+                    # execution stats would drag down average_execution_time
+                    self._cache_stats['hits'] += 1
+                    # Copied on the way out as well as in, so no caller can mutate the cached data
+                    return replace(cached, data=copy.deepcopy(cached.data), execution_time=0.0)
+                self._cache_stats['misses'] += 1
+            
+            # Mock tools are plain functions; only real MCP calls need to be awaited
+            result = tool_function(**kwargs)
+            if inspect.isawaitable(result):
+                result = await result
             
-            # Log execution
-            self.execution_log.append({
-                'tool': tool_name,
-                'success': result.success,
-                'confidence': result.confidence,
-                'execution_time': result.execution_time,
-                'timestamp': asyncio.get_event_loop().time()
-            })
+            if cache_key is not None and result.success:
+                self._result_cache[cache_key] = replace(result, data=copy.deepcopy(result.data))
+                if len(self._result_cache) > _RESULT_CACHE_SIZE:
+                    self._result_cache.popitem(last=False)
             
+            self._record_execution(tool_name, result)
             return result
             
         except Exception as e:
@@ -238,94 +454,302 @@ class MCPToolOrchestrator:
                 error_message=str(e)
             )
     
-    async def execute_pattern(self, pattern: List[Dict[str, str]], query: str) -> List[MCPToolResult]:
+    def _record_execution(self, tool_name: str, result: MCPToolResult):
+        """Log an execution and fold it into the running stats"""
+        slot = self._total_executions & _EXECUTION_LOG_MASK
+        self._log_tool[slot] = self._tool_ids[tool_name]
+        self._log_success[slot] = result.success
+        self._log_confidence[slot] = result.confidence
+        self._log_time[slot] = result.execution_time
+        self._log_timestamp[slot] = time.monotonic()
+        
+        totals = self._tool_totals.get(tool_name)
+        if totals is None:
+            totals = self._tool_totals[tool_name] = {'count': 0, 'confidence_sum': 0.0, 'time_sum': 0.0}
+        totals['count'] += 1
+        totals['confidence_sum'] += result.confidence
+        totals['time_sum'] += result.execution_time
+        self._total_executions += 1
+        self._total_successes += result.success
+    
+    async def _execute_batch(self, calls: List[Tuple[str, Dict[str, Any]]],
+                             stop_on_error: bool = False) -> List[MCPToolResult]:
+        """
+        Execute independent tool calls as one batch_execute request
+        
+        Expects the aggregator to answer with JSON text of the form
+        {"results": [{"success", "result", "confidence", "error"}, ...]} in
+        call order. Calls missing from a short reply (e.g. after stopOnError)
+        are reported as cancelled. Falls back to concurrent single calls, with
+        the same stop_on_error behavior, if the batch fails.
+        """
+        payload = {
+            'calls': [{'tool': tool_name, 'args': params} for tool_name, params in calls],
+            'maxConcurrent': _MAX_CONCURRENT,
+            'stopOnError': stop_on_error,
+            'timeoutMs': _BATCH_TIMEOUT_MS
+        }
+        start = time.perf_counter()
+        try:
+            response = await self.call_server_tool(self.batch_server, 'batch_execute', payload)
+            entries = json.loads(response.content[0].text)['results']
+        except Exception:
+            if stop_on_error:
+                return await self._execute_until_error(calls)
+            return await asyncio.gather(*(self._execute_bounded(tool_name, params) for tool_name, params in calls))
+        
+        elapsed = time.perf_counter() - start
+        results = []
+        for (tool_name, _), entry in zip(calls, entries):
+            result = MCPToolResult(
+                tool_name=tool_name,
+                success=bool(entry.get('success')),
+                data=entry.get('result'),
+                confidence=float(entry.get('confidence', 0.0)),
+                execution_time=elapsed,
+                error_message=entry.get('error')
+            )
+            self._record_execution(tool_name, result)
+            results.append(result)
+        results.extend(_cancelled_result(tool_name) for tool_name, _ in calls[len(results):])
+        return results
+    
+    async def _execute_bounded(self, tool_name: str, params: Dict[str, Any]) -> MCPToolResult:
+        """Execute a tool while holding a slot of the fan-out semaphore"""
+        self._bind_loop()
+        async with self._semaphore:
+            return await self.execute_tool(tool_name, **params)
+    
+    def _step_params(self, tool_name: str, context: str) -> Dict[str, Any]:
+        """Build the parameters of a pattern step from the current chain context"""
+        build = self._PARAM_BUILDERS.get(tool_name, _default_params)
+        return build(context, self._total_executions)
+    
+    @staticmethod
+    def _group_steps(pattern: List[Dict[str, str]]) -> List[List[Dict[str, str]]]:
+        """Split a pattern into runs of retrieval steps and single chained steps"""
+        groups = []
+        for step in pattern:
+            if groups and step['tool'] in _PARALLEL_TOOLS and groups[-1][-1]['tool'] in _PARALLEL_TOOLS:
+                groups[-1].append(step)
+            else:
+                groups.append([step])
+        return groups
+    
+    async def execute_pattern(self, pattern: List[Dict[str, str]], query: str,
+                              stop_on_error: bool = False) -> List[MCPToolResult]:
         """
         Execute a complete HRM pattern with MCP tools
         
+        Contiguous retrieval steps run concurrently on the same context, as
+        one batch_execute call when a batch server is configured; every other
+        step waits for, and builds on, the results before it.
+        
         Args:
             pattern: List of tool execution steps
             query: Query to process
+            stop_on_error: Stop at the first failed step, cancelling steps still
+                in flight; every step not run is reported as cancelled
             
         Returns:
-            List of MCPToolResult objects
+            List of MCPToolResult objects, in pattern order
         """
         results = []
-        context = query
+        context = _ChainContext(query)
+        groups = self._group_steps(pattern)
         
-        for step in pattern:
-            tool_name = step['tool']
-            purpose = step.get('purpose', 'No purpose specified')
+        for g, group in enumerate(groups):
+            for step in group:
+                print(f"Executing {step['tool']}: {step.get('purpose', 'No purpose specified')}")
             
-            print(f"Executing {tool_name}: {purpose}")
-            
-            # Prepare tool-specific parameters
-            if tool_name == 'brain_recall':
-                params = {'query': context}
-            elif tool_name == 'web_search':
-                params = {'query': context}
-            elif tool_name == 'brain_remember':
-                # Generate synthesis for storage
-                synthesis = f"HRM synthesis: {context}"
-                key = f"hrm_{tool_name}_{len(self.execution_log)}"
-                params = {'key': key, 'content': synthesis}
-            elif tool_name in ['sequential_thinking', 'reasoning_tools']:
-                params = {'problem': context}
+            # Execute tool(s), keeping pattern order
+            calls = None if len(group) == 1 else [
+                (step['tool'], self._step_params(step['tool'], context.text)) for step in group
+            ]
+            if calls is None:
+                tool_name = group[0]['tool']
+                group_results = [await self.execute_tool(tool_name, **self._step_params(tool_name, context.text))]
+            elif self.batch_server is not None:
+                group_results = await self._execute_batch(calls, stop_on_error)
+            elif stop_on_error:
+                group_results = await self._execute_until_error(calls)
             else:
-                params = {'query': context}
+                group_results = await asyncio.gather(*(self._execute_bounded(*call) for call in calls))
             
-            # Execute tool
-            result = await self.execute_tool(tool_name, **params)
-            results.append(result)
+            for result in group_results:
+                results.append(result)
+                context.add(result)
             
-            # Update context for next tool (chain reasoning)
-            if result.success and result.data:
-                if isinstance(result.data, dict) and 'data' in result.data:
-                    context = f"{context} | {result.data['data']}"
-                else:
-                    context = f"{context} | {str(result.data)[:100]}"
+            if stop_on_error and not all(result.success for result in group_results):
+                results.extend(_cancelled_result(step['tool']) for later in groups[g + 1:] for step in later)
+                break
         
         return results
     
-    def get_tool_stats(self) -> Dict[str, Any]:
-        """Get statistics about tool usage and performance"""
-        if not self.execution_log:
-            return {'total_executions': 0}
+    async def _execute_until_error(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[MCPToolResult]:
+        """Execute calls concurrently, cancelling the rest as soon as one fails"""
+        tasks = [asyncio.ensure_future(self._execute_bounded(tool_name, params)) for tool_name, params in calls]
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            if not all(task.result().success for task in done):
+                break
         
-        # Calculate statistics
-        total_executions = len(self.execution_log)
-        successful_executions = sum(1 for log in self.execution_log if log['success'])
-        success_rate = successful_executions / total_executions
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
         
-        # Tool usage frequency
-        tool_usage = {}
-        avg_confidence = {}
-        avg_execution_time = {}
+        return [
+            _cancelled_result(tool_name) if task.cancelled() else task.result()
+            for task, (tool_name, _) in zip(tasks, calls)
+        ]
+    
+    async def execute_pattern_streaming(self, pattern: List[Dict[str, str]], query: str,
+                                        stop: Optional[Callable[[MCPToolResult], bool]] = None
+                                        ) -> AsyncIterator[MCPToolResult]:
+        """
+        Execute an HRM pattern, yielding each result as soon as it completes
         
-        for log in self.execution_log:
-            tool = log['tool']
-            tool_usage[tool] = tool_usage.get(tool, 0) + 1
-            
-            if tool not in avg_confidence:
-                avg_confidence[tool] = []
-                avg_execution_time[tool] = []
+        Concurrent retrieval steps are yielded in completion order. Once stop
+        returns True for a result, steps still in flight are cancelled and
+        only the remaining brain_remember steps run, so the synthesis is
+        still stored.
+        
+        Args:
+            pattern: List of tool execution steps
+            query: Query to process
+            stop: Optional early-termination check, called with each result
             
-            avg_confidence[tool].append(log['confidence'])
-            avg_execution_time[tool].append(log['execution_time'])
+        Yields:
+            MCPToolResult objects, in completion order
+        """
+        async for _, result in self._stream_pattern(pattern, query, stop):
+            yield result
+    
+    async def _stream_pattern(self, pattern: List[Dict[str, str]], query: str,
+                              stop: Optional[Callable[[MCPToolResult], bool]] = None
+                              ) -> AsyncIterator[Tuple[int, MCPToolResult]]:
+        """Body of execute_pattern_streaming, yielding (pattern index, result) pairs"""
+        context = _ChainContext(query)
+        stopped = False
+        index = 0
         
-        # Calculate averages
-        for tool in avg_confidence:
-            avg_confidence[tool] = sum(avg_confidence[tool]) / len(avg_confidence[tool])
-            avg_execution_time[tool] = sum(avg_execution_time[tool]) / len(avg_execution_time[tool])
+        for group in self._group_steps(pattern):
+            start, index = index, index + len(group)
+            if stopped and group[0]['tool'] not in _STORAGE_TOOLS:
+                continue
+            for step in group:
+                print(f"Executing {step['tool']}: {step.get('purpose', 'No purpose specified')}")
+            
+            if len(group) == 1:
+                tool_name = group[0]['tool']
+                result = await self.execute_tool(tool_name, **self._step_params(tool_name, context.text))
+                yield start, result
+                context.add(result)
+                stopped = stopped or (stop is not None and stop(result))
+                continue
+            
+            tasks = {
+                asyncio.ensure_future(self._execute_bounded(step['tool'], self._step_params(step['tool'], context.text))): start + offset
+                for offset, step in enumerate(group)
+            }
+            pending = set(tasks)
+            try:
+                while pending and not stopped:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    # Tasks finishing together are yielded in pattern order
+                    for task in sorted(done, key=tasks.__getitem__):
+                        result = task.result()
+                        yield tasks[task], result
+                        context.add(result)
+                        if stop is not None and stop(result):
+                            stopped = True
+                            break
+            finally:
+                for task in pending:
+                    task.cancel()
+                if pending:
+                    await asyncio.gather(*pending, return_exceptions=True)
+    
+    @property
+    def execution_log(self) -> List[Dict[str, Any]]:
+        """Retained execution entries, oldest first"""
+        total = self._total_executions
+        return [
+            {
+                'tool': self._tool_names[self._log_tool[slot]],
+                'success': bool(self._log_success[slot]),
+                'confidence': self._log_confidence[slot],
+                'execution_time': self._log_time[slot],
+                'timestamp': self._log_timestamp[slot]
+            }
+            for slot in (i & _EXECUTION_LOG_MASK for i in range(max(0, total - _EXECUTION_LOG_SIZE), total))
+        ]
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get result cache size and hit statistics"""
+        lookups = self._cache_stats['hits'] + self._cache_stats['misses']
+        return {
+            **self._cache_stats,
+            'size': len(self._result_cache),
+            'hit_rate': self._cache_stats['hits'] / lookups if lookups else 0.0
+        }
+    
+    def get_tool_stats(self) -> Dict[str, Any]:
+        """Get statistics about tool usage and performance"""
+        if not self._total_executions:
+            return {'total_executions': 0}
         
         return {
-            'total_executions': total_executions,
-            'success_rate': success_rate,
-            'tool_usage': tool_usage,
-            'average_confidence': avg_confidence,
-            'average_execution_time': avg_execution_time,
+            'total_executions': self._total_executions,
+            'success_rate': self._total_successes / self._total_executions,
+            'tool_usage': {tool: t['count'] for tool, t in self._tool_totals.items()},
+            'average_confidence': {tool: t['confidence_sum'] / t['count'] for tool, t in self._tool_totals.items()},
+            'average_execution_time': {tool: t['time_sum'] / t['count'] for tool, t in self._tool_totals.items()},
             'available_tools': list(self.available_tools.keys())
         }
 
+# Orchestrators shared by every HRMWithMCP with the same config key, so the tool
+# registry, result cache and MCP sessions are built once per process. Their tool
+# stats cover every caller; HRMWithMCP counts its own executions separately
+_ORCHESTRATOR_CACHE: Dict[str, MCPToolOrchestrator] = {}
+_ORCHESTRATOR_OPTIONS: Dict[str, Dict[str, Any]] = {}  # config_key -> options it was created with
+_orchestrator_cache_stats = {'hits': 0, 'misses': 0}
+
+
+def get_orchestrator(config_key: str = 'default', **options) -> MCPToolOrchestrator:
+    """
+    Return the shared orchestrator for a configuration, creating it on first use
+    
+    Args:
+        config_key: Name of the orchestrator configuration
+        **options: MCPToolOrchestrator arguments; once it exists, omit them
+            or pass the same ones
+        
+    Returns:
+        The process-wide MCPToolOrchestrator for config_key
+        
+    Raises:
+        ValueError: If options differ from those config_key was created with
+    """
+    orchestrator = _ORCHESTRATOR_CACHE.get(config_key)
+    if orchestrator is None:
+        _orchestrator_cache_stats['misses'] += 1
+        orchestrator = _ORCHESTRATOR_CACHE[config_key] = MCPToolOrchestrator(**options)
+        _ORCHESTRATOR_OPTIONS[config_key] = options
+    else:
+        if options and options != _ORCHESTRATOR_OPTIONS[config_key]:
+            raise ValueError(f"Orchestrator '{config_key}' already exists with options "
+                             f"{_ORCHESTRATOR_OPTIONS[config_key]}; use another config_key for {options}")
+        _orchestrator_cache_stats['hits'] += 1
+    return orchestrator
+
+
+def get_orchestrator_cache_stats() -> Dict[str, Any]:
+    """Get shared orchestrator cache statistics"""
+    return {**_orchestrator_cache_stats, 'configs': list(_ORCHESTRATOR_CACHE)}
+
 
 class HRMWithMCP:
     """
@@ -334,17 +758,23 @@ class HRMWithMCP:
     This combines the core HRM system with real MCP tool orchestration.
     """
     
-    def __init__(self):
+    def __init__(self, config_key: str = 'default'):
         from .hrm_core import HRMSystem
         self.hrm_core = HRMSystem()
-        self.mcp_orchestrator = MCPToolOrchestrator()
+        self.config_key = config_key
+        self.mcp_orchestrator = get_orchestrator(config_key)
+        # Per-instance counts; the orchestrator's own stats are shared by its config_key
+        self._tool_executions = 0
+        self._tool_successes = 0
     
-    async def execute_with_mcp(self, query: str) -> Dict[str, Any]:
+    async def execute_with_mcp(self, query: str, stop_on_convergence: bool = False) -> Dict[str, Any]:
         """
         Execute HRM with real MCP tool integration
         
         Args:
             query: Query to process
+            stop_on_convergence: Skip the remaining reasoning steps, except
+                storage, as soon as the results converge
             
         Returns:
             Complete execution result with MCP tool data
@@ -359,26 +789,32 @@ class HRMWithMCP:
         print(f"Hierarchical Levels: {analysis['hierarchical_levels']}")
         print("-" * 50)
         
-        # Phase 2: Execute pattern with real MCP tools
-        mcp_results = await self.mcp_orchestrator.execute_pattern(
-            analysis['pattern'], 
-            query
-        )
+        # Phase 2: Execute pattern with real MCP tools. When stopping early,
+        # convergence is tracked as each result arrives so outstanding steps
+        # can be cancelled; results are reported in pattern order either way
+        if stop_on_convergence:
+            live = self.hrm_core.convergence_detector.spawn()
+            
+            def converged(result: MCPToolResult) -> bool:
+                live.push_result({'success': result.success, 'confidence': result.confidence})
+                return live.detect(iteration=1)['converged']
+            
+            indexed = [
+                item async for item in
+                self.mcp_orchestrator._stream_pattern(analysis['pattern'], query, stop=converged)
+            ]
+            mcp_results = [result for _, result in sorted(indexed, key=lambda item: item[0])]
+        else:
+            mcp_results = await self.mcp_orchestrator.execute_pattern(analysis['pattern'], query)
         
-        # Phase 3: Analyze convergence
-        results_for_convergence = [
-            {
-                'success': r.success,
-                'confidence': r.confidence,
-                'data': str(r.data) if r.data else ''
-            }
-            for r in mcp_results
-        ]
+        self._tool_executions += len(mcp_results)
+        self._tool_successes += sum(r.success for r in mcp_results)
         
-        convergence = self.hrm_core.convergence_detector.detect_convergence(
-            results_for_convergence, 
-            iteration=1
-        )
+        # Phase 3: Analyze convergence over the results in pattern order
+        detector = self.hrm_core.convergence_detector.spawn()
+        for result in mcp_results:
+            detector.push_result({'success': result.success, 'confidence': result.confidence})
+        convergence = detector.detect(iteration=1)
         
         return {
             'query': query,
@@ -389,7 +825,7 @@ class HRMWithMCP:
                     'success': r.success,
                     'confidence': r.confidence,
                     'execution_time': r.execution_time,
-                    'data_preview': str(r.data)[:200] if r.data else None,
+                    'data_preview': r.preview,
                     'error': r.error_message
                 }
                 for r in mcp_results
@@ -400,7 +836,13 @@ class HRMWithMCP:
         }
     
     def get_system_status(self) -> Dict[str, Any]:
-        """Get comprehensive system status including MCP integration"""
+        """
+        Get comprehensive system status including MCP integration
+        
+        total_tool_executions and tool_success_rate cover this instance's
+        executions only; shared_orchestrator reports the orchestrator this
+        instance shares with every HRMWithMCP of the same config_key.
+        """
         core_status = self.hrm_core.get_system_status()
         mcp_stats = self.mcp_orchestrator.get_tool_stats()
         
@@ -408,9 +850,14 @@ class HRMWithMCP:
             **core_status,
             'mcp_integration': {
                 'status': '✅ Proof of concept working',
-                'available_tools': mcp_stats.get('available_tools', []),
-                'total_tool_executions': mcp_stats.get('total_executions', 0),
-                'tool_success_rate': mcp_stats.get('success_rate', 0.0)
+                'available_tools': list(self.mcp_orchestrator.available_tools),
+                'total_tool_executions': self._tool_executions,
+                'tool_success_rate': self._tool_successes / max(self._tool_executions, 1),
+                'shared_orchestrator': {
+                    'config_key': self.config_key,
+                    'total_tool_executions': mcp_stats['total_executions'],
+                    'cached_tool_calls': self.mcp_orchestrator.get_cache_stats()['hits']
+                }
             }
         }
 
@@ -453,4 +900,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
@@ -16,6 +16,7 @@ import time
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from hrm_claude_functional import execute_hrm_production, test_hrm_functional_integration
+from hrm_runtime import install_uvloop
 
 
 async def main():
@@ -40,4 +41,5 @@ async def main():
     
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
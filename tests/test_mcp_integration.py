@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+HRM MCP Integration Test: Validate Orchestrated Pattern Execution
+================================================================
+
+Checks result ordering, early stopping and cancellation in
+MCPToolOrchestrator and HRMWithMCP, using fake tools with set delays.
+"""
+
+import asyncio
+import json
+import sys
+import os
+from types import SimpleNamespace
+
+# Add the repository root to path; the src modules use package-relative imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.mcp_integration import HRMWithMCP, MCPToolOrchestrator, MCPToolResult
+
+
+def fake_tool(name, delay, success=True, confidence=0.9, events=None):
+    """Tool coroutine that finishes after delay seconds, noting cancellation in events"""
+    async def run(**params):
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            if events is not None:
+                events.append(f"{name} cancelled")
+            raise
+        return MCPToolResult(name, success, {'tool': name}, confidence if success else 0.0, delay,
+                             None if success else f"{name} failed")
+    return run
+
+
+def fake_orchestrator(delays, events=None):
+    """Orchestrator whose tools are fakes; delays maps tool name to seconds"""
+    orchestrator = MCPToolOrchestrator()
+    orchestrator._tool_funcs = {name: fake_tool(name, delay, events=events) for name, delay in delays.items()}
+    return orchestrator
+
+
+def test_execute_with_mcp_reports_pattern_order():
+    """Concurrent steps finishing out of order are still reported in pattern order"""
+    print("\n🔧 Test: HRMWithMCP results in pattern order")
+    query = "Compare machine learning and deep learning"  # brain_recall, web_search, brain_remember
+
+    async def run(stop_on_convergence):
+        hrm = HRMWithMCP(config_key='test-pattern-order')
+        hrm.mcp_orchestrator = fake_orchestrator({'brain_recall': 0.05, 'web_search': 0.0, 'brain_remember': 0.0})
+        return await hrm.execute_with_mcp(query, stop_on_convergence=stop_on_convergence)
+
+    for stop_on_convergence in (False, True):
+        result = asyncio.run(run(stop_on_convergence))
+        tools = [entry['tool'] for entry in result['mcp_results']]
+        assert tools == ['brain_recall', 'web_search', 'brain_remember'], (stop_on_convergence, tools)
+        assert result['convergence']['converged']
+    print("  ✅ Same order with and without early stopping")
+
+
+def test_streaming_stop_cancels_and_awaits_steps():
+    """Stopping a stream cancels in-flight steps before the stream finishes"""
+    print("\n🔧 Test: Early stop cancels in-flight steps")
+    events = []
+    pattern = [
+        {'tool': 'brain_recall', 'purpose': 'fast'},
+        {'tool': 'web_search', 'purpose': 'slow'},
+        {'tool': 'sequential_thinking', 'purpose': 'skipped after stop'},
+        {'tool': 'brain_remember', 'purpose': 'still stored'},
+    ]
+
+    async def run():
+        orchestrator = fake_orchestrator({'brain_recall': 0.0, 'web_search': 10.0,
+                                          'sequential_thinking': 0.0, 'brain_remember': 0.0}, events)
+        results = []
+        async for result in orchestrator.execute_pattern_streaming(pattern, "query", stop=lambda result: True):
+            results.append(result.tool_name)
+            events.append(f"{result.tool_name} yielded")
+        return results
+
+    results = asyncio.run(asyncio.wait_for(run(), timeout=2))
+    assert results == ['brain_recall', 'brain_remember']
+    assert events == ['brain_recall yielded', 'web_search cancelled', 'brain_remember yielded']
+    print("  ✅ Slow step cancelled and awaited; storage step still ran")
+
+
+def test_cache_hits_keep_execution_stats_accurate():
+    """Repeat calls hit the cache on canonical kwargs without skewing execution times"""
+    print("\n🔧 Test: Result cache keys and execution stats")
+
+    async def run():
+        orchestrator = fake_orchestrator({'web_search': 0.01})
+        first = await orchestrator.execute_tool('web_search', query="q", filters={'b': 2, 'a': frozenset({'x'})})
+        hit = await orchestrator.execute_tool('web_search', filters={'a': frozenset({'x'}), 'b': 2}, query="q")
+        return orchestrator, first, hit
+
+    orchestrator, first, hit = asyncio.run(run())
+    assert first.execution_time == 0.01 and hit.execution_time == 0.0
+    assert hit.data == first.data and hit.data is not first.data
+    assert orchestrator.get_cache_stats()['hits'] == 1
+    stats = orchestrator.get_tool_stats()
+    assert stats['total_executions'] == 1
+    assert stats['average_execution_time']['web_search'] == 0.01
+    print("  ✅ Reordered kwargs hit the cache; hit left the averages alone")
+
+
+def test_status_counts_per_instance():
+    """Instances sharing an orchestrator report their own executions and the shared totals apart"""
+    print("\n🔧 Test: Per-instance status on a shared orchestrator")
+    busy = HRMWithMCP(config_key='test-status')
+    idle = HRMWithMCP(config_key='test-status')
+    assert busy.mcp_orchestrator is idle.mcp_orchestrator
+
+    asyncio.run(busy.execute_with_mcp("What is quantum computing?"))
+    busy_status = busy.get_system_status()['mcp_integration']
+    idle_status = idle.get_system_status()['mcp_integration']
+    assert busy_status['total_tool_executions'] > 0
+    assert idle_status['total_tool_executions'] == 0
+    assert idle_status['shared_orchestrator'] == busy_status['shared_orchestrator']
+    assert idle_status['shared_orchestrator']['total_tool_executions'] == busy_status['total_tool_executions']
+    print("  ✅ Idle instance reports no executions of its own")
+
+
+def test_sessions_dropped_on_new_loop():
+    """Sessions opened on one event loop are not reused from another"""
+    print("\n🔧 Test: MCP sessions across event loops")
+    orchestrator = MCPToolOrchestrator(servers={'brain': {'command': 'brain-server'}})
+    session = object()
+
+    async def first_loop():
+        orchestrator._bind_loop()
+        orchestrator._sessions['brain'] = session
+        assert await orchestrator._ensure_session('brain') is session
+        return orchestrator._exit_stack
+
+    async def second_loop():
+        orchestrator._bind_loop()
+
+    stack = asyncio.run(first_loop())
+    asyncio.run(second_loop())
+    assert not orchestrator._sessions
+    assert orchestrator._exit_stack is not stack
+    print("  ✅ Stale session dropped when the loop changed")
+
+
+def batch_server(orchestrator, reply=None, error=None):
+    """Route the orchestrator's batch_execute calls to a fake server; returns the payloads it received"""
+    payloads = []
+
+    async def call_server_tool(server, name, arguments):
+        payloads.append(arguments)
+        if error is not None:
+            raise error
+        return SimpleNamespace(content=[SimpleNamespace(text=json.dumps(reply))])
+
+    orchestrator.batch_server = 'batch'
+    orchestrator.call_server_tool = call_server_tool
+    return payloads
+
+
+def test_batch_results_and_fallback():
+    """Retrieval steps go out as one batch; short replies cancel the rest and failures fall back"""
+    print("\n🔧 Test: batch_execute dispatch")
+    pattern = [{'tool': 'brain_recall'}, {'tool': 'web_search'}, {'tool': 'brain_remember'}]
+    delays = {'brain_recall': 0.0, 'web_search': 0.0, 'brain_remember': 0.0}
+
+    orchestrator = fake_orchestrator(delays)
+    payloads = batch_server(orchestrator, reply={'results': [
+        {'success': True, 'result': {'via': 'batch'}, 'confidence': 0.7}
+    ]})
+    results = asyncio.run(orchestrator.execute_pattern(pattern, "query"))
+    assert [call['tool'] for call in payloads[0]['calls']] == ['brain_recall', 'web_search']
+    assert results[0].data == {'via': 'batch'} and results[0].confidence == 0.7
+    assert results[1].error_message == 'cancelled' and not results[1].success
+    assert results[2].data == {'tool': 'brain_remember'}
+
+    orchestrator = fake_orchestrator(delays)
+    payloads = batch_server(orchestrator, error=ConnectionError("batch server down"))
+    results = asyncio.run(orchestrator.execute_pattern(pattern, "query"))
+    assert len(payloads) == 1
+    assert [result.data for result in results] == [{'tool': 'brain_recall'}, {'tool': 'web_search'},
+                                                   {'tool': 'brain_remember'}]
+    print("  ✅ Short reply padded with cancelled steps; failed batch ran tools one by one")
+
+
+def test_stop_on_error_cancels_remaining_steps():
+    """A failed step cancels steps in flight and reports every later step as cancelled"""
+    print("\n🔧 Test: execute_pattern(stop_on_error=True)")
+    pattern = [{'tool': 'brain_recall'}, {'tool': 'web_search'}, {'tool': 'brain_remember'}]
+
+    for batched in (False, True):
+        events = []
+        orchestrator = fake_orchestrator({'brain_remember': 0.0}, events)
+        orchestrator._tool_funcs['brain_recall'] = fake_tool('brain_recall', 0.0, success=False, events=events)
+        orchestrator._tool_funcs['web_search'] = fake_tool('web_search', 10.0, events=events)
+        if batched:
+            batch_server(orchestrator, error=ConnectionError("batch server down"))
+
+        results = asyncio.run(asyncio.wait_for(
+            orchestrator.execute_pattern(pattern, "query", stop_on_error=True), timeout=2))
+        assert [result.tool_name for result in results] == ['brain_recall', 'web_search', 'brain_remember']
+        assert results[0].error_message == 'brain_recall failed'
+        assert [result.error_message for result in results[1:]] == ['cancelled', 'cancelled']
+        assert events == ['web_search cancelled'], (batched, events)
+    print("  ✅ Slow step cancelled and later steps skipped, with and without a failing batch server")
+
+
+def main():
+    """Run every MCP integration test"""
+    print("🧪 Testing MCP Integration")
+    print("=" * 50)
+
+    test_execute_with_mcp_reports_pattern_order()
+    test_streaming_stop_cancels_and_awaits_steps()
+    test_cache_hits_keep_execution_stats_accurate()
+    test_status_counts_per_instance()
+    test_sessions_dropped_on_new_loop()
+    test_batch_results_and_fallback()
+    test_stop_on_error_cancels_remaining_steps()
+
+    print(f"\n✅ All MCP integration tests completed successfully!")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,7 @@ import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
 
 from hrm_automation_engine import HRMProductionSystem, execute_hrm_query
+from hrm_runtime import install_uvloop
 
 
 async def test_modular_architecture():
@@ -65,4 +66,5 @@ async def test_modular_architecture():
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(test_modular_architecture())
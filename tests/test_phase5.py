@@ -17,6 +17,8 @@ from typing import Dict, Any, List
 # Add src to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
 
+from hrm_runtime import install_uvloop
+
 
 class ExecutionPhase(Enum):
     """HRM execution phases"""
@@ -48,7 +50,7 @@ class Phase5TestSystem:
         
     async def test_brain_recall(self, query: str) -> MCPExecutionResult:
         """Test brain_recall integration"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # Simulate realistic brain_recall behavior
@@ -71,7 +73,7 @@ class Phase5TestSystem:
                 success=True,
                 data=mock_data,
                 confidence=mock_data['search_confidence'],
-                execution_time=time.time() - start_time,
+                execution_time=time.perf_counter() - start_time,
                 phase=ExecutionPhase.ANALYSIS
             )
             
@@ -81,14 +83,14 @@ class Phase5TestSystem:
                 success=False,
                 data=None,
                 confidence=0.0,
-                execution_time=time.time() - start_time,
+                execution_time=time.perf_counter() - start_time,
                 phase=ExecutionPhase.ANALYSIS,
                 error_message=str(e)
             )
     
     async def test_web_search(self, query: str) -> MCPExecutionResult:
         """Test web_search integration"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             mock_data = {
@@ -108,7 +110,7 @@ class Phase5TestSystem:
                 success=True,
                 data=mock_data,
                 confidence=mock_data['search_confidence'],
-                execution_time=time.time() - start_time,
+                execution_time=time.perf_counter() - start_time,
                 phase=ExecutionPhase.ORCHESTRATION
             )
             
@@ -118,7 +120,7 @@ class Phase5TestSystem:
                 success=False,
                 data=None,
                 confidence=0.0,
-                execution_time=time.time() - start_time,
+                execution_time=time.perf_counter() - start_time,
                 phase=ExecutionPhase.ORCHESTRATION,
                 error_message=str(e)
             )
@@ -126,9 +128,10 @@ class Phase5TestSystem:
     async def execute_pattern(self, pattern: List[str], query: str) -> List[MCPExecutionResult]:
         """Execute a complete reasoning pattern"""
         results = []
-        context = query
+        context_parts = [query]
         
         for tool_name in pattern:
+            context = ' | '.join(context_parts)
             if tool_name == 'brain_recall':
                 result = await self.test_brain_recall(context)
             elif tool_name == 'web_search':
@@ -152,11 +155,11 @@ class Phase5TestSystem:
             if result.success and result.data:
                 if isinstance(result.data, dict):
                     if 'memories' in result.data:
-                        context = f"{context} | Memory: {result.data['memories'][0]['content'][:50]}"
+                        context_parts.append(f"Memory: {result.data['memories'][0]['content'][:50]}")
                     elif 'results' in result.data:
-                        context = f"{context} | Search: {result.data['results'][0]['snippet'][:50]}"
+                        context_parts.append(f"Search: {result.data['results'][0]['snippet'][:50]}")
                     else:
-                        context = f"{context} | {str(result.data)[:50]}"
+                        context_parts.append(str(result.data)[:50])
         
         return results
 
@@ -194,9 +197,9 @@ async def test_phase5_integration():
         print("-" * 50)
         
         # Execute pattern
-        start_time = time.time()
+        start_time = time.perf_counter()
         results = await system.execute_pattern(test_case['pattern'], test_case['query'])
-        total_time = time.time() - start_time
+        total_time = time.perf_counter() - start_time
         
         # Display results
         for j, result in enumerate(results, 1):
@@ -207,8 +210,10 @@ async def test_phase5_integration():
             if result.error_message:
                 print(f"    Error: {result.error_message}")
         
-        success_rate = sum(1 for r in results if r.success) / len(results)
-        avg_confidence = sum(r.confidence for r in results if r.success) / max(sum(1 for r in results if r.success), 1)
+        # One pass over the results for both aggregates
+        successful_confidences = [r.confidence for r in results if r.success]
+        success_rate = len(successful_confidences) / len(results)
+        avg_confidence = sum(successful_confidences) / max(len(successful_confidences), 1)
         
         print(f"\n  📊 Pattern Results:")
         print(f"    Success Rate: {success_rate:.1%}")
@@ -267,4 +272,5 @@ if __name__ == "__main__":
         print("  Real-World Integration Ready")
         print("🎊" + " " * 25 + "🎊")
     
+    install_uvloop()
     asyncio.run(main())
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+HRM Phase 5 Engine Test: Validate the Production Execution Engine
+================================================================
+
+Checks Phase5ExecutionEngine and HRMPhase5System behavior with mock
+MCP tools: execution bookkeeping, retries and result layouts.
+"""
+
+import asyncio
+import sys
+import os
+
+# Add the repository root to path; the src modules use package-relative imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src import hrm_phase5
+from src.hrm_automation_engine import ExecutionPhase, MCPExecutionResult
+
+
+def tool_result(tool_name, success=True, error=None):
+    """MCP result for a fake tool call"""
+    return MCPExecutionResult(tool_name, success, {'tool': tool_name} if success else None,
+                              0.9 if success else 0.0, 0.0, ExecutionPhase.ORCHESTRATION, error)
+
+
+def fake_engine(run, **options):
+    """Phase 5 engine whose tool calls go to the coroutine function run(tool_name, **params)"""
+    engine = hrm_phase5.Phase5ExecutionEngine(use_real_tools=False, **options)
+    engine.mcp_integration.execute_tool = run
+    return engine
+
+
+def test_total_executions_outlive_bounded_history():
+    """The execution count keeps growing once old history entries are dropped"""
+    print("\n🔧 Test: Execution count past the history bound")
+    size = hrm_phase5._HISTORY_SIZE
+    hrm_phase5._HISTORY_SIZE = 2
+    try:
+        engine = hrm_phase5.Phase5ExecutionEngine(use_real_tools=False)
+    finally:
+        hrm_phase5._HISTORY_SIZE = size
+
+    async def run():
+        for _ in range(5):
+            await engine.execute("What is AI?")
+
+    asyncio.run(run())
+    status = engine.get_status()
+    assert status['total_executions'] == 5
+    assert status['history_size'] == 2
+    assert 0.0 <= status['success_rate'] <= 1.0
+    print("  ✅ 5 executions counted with 2 kept in history")
+
+
+def test_independent_steps_run_concurrently():
+    """Back-to-back independent tools share a segment and run together; results stay in pattern order"""
+    print("\n🔧 Test: Concurrent pattern segments")
+    events = []
+    delays = {'brain_recall': 0.05, 'web_search': 0.0, 'brain_remember': 0.0}
+
+    async def run(tool_name, **params):
+        events.append(f"{tool_name} started")
+        await asyncio.sleep(delays[tool_name])
+        events.append(f"{tool_name} finished")
+        return tool_result(tool_name)
+
+    engine = fake_engine(run)
+    pattern = ['brain_recall', 'web_search', 'brain_remember']
+    assert engine.pattern_orchestrator.get_segments(pattern + ['brain_recall']) == [
+        ['brain_recall', 'web_search'], ['brain_remember'], ['brain_recall']]
+
+    results = asyncio.run(engine._execute_pattern_with_retries(pattern, "What is AI?"))
+    assert [result.tool_name for result in results] == pattern
+    assert events == ['brain_recall started', 'web_search started', 'web_search finished',
+                      'brain_recall finished', 'brain_remember started', 'brain_remember finished']
+    print("  ✅ Recall and search overlapped; remember waited for both")
+
+
+def test_retry_backoff_is_jittered_and_capped():
+    """Retry delays are drawn from an exponentially growing window capped at retry_max_delay"""
+    print("\n🔧 Test: Jittered exponential retry backoff")
+    windows = []
+    calls = []
+
+    async def run(tool_name, **params):
+        calls.append(tool_name)
+        if len(calls) < 3:
+            return tool_result(tool_name, success=False, error=f"attempt {len(calls)} failed")
+        return tool_result(tool_name)
+
+    engine = fake_engine(run, max_retries=3, retry_base_delay=0.25, retry_max_delay=1.0)
+    uniform = hrm_phase5.random.uniform
+    hrm_phase5.random.uniform = lambda low, high: windows.append((low, high)) or 0.0
+    try:
+        async def backoffs():
+            for attempt in range(5):
+                await engine._backoff(attempt)
+
+        asyncio.run(backoffs())
+        assert windows == [(0, 0.25), (0, 0.5), (0, 1.0), (0, 1.0), (0, 1.0)]
+
+        windows.clear()
+        results = asyncio.run(engine._execute_pattern_with_retries(['brain_recall'], "What is AI?"))
+    finally:
+        hrm_phase5.random.uniform = uniform
+
+    assert results[0].success and results[0].retry_count == 2
+    assert windows == [(0, 0.25), (0, 0.5)]
+    print("  ✅ Windows doubled up to the cap; third attempt succeeded")
+
+
+def test_repeated_failures_stop_retries_and_pattern():
+    """Identical failures end a step's retries early and then abandon the rest of the pattern"""
+    print("\n🔧 Test: Repeated identical failures")
+    calls = []
+
+    async def run(tool_name, **params):
+        calls.append(tool_name)
+        return tool_result(tool_name, success=False, error="brain server down")
+
+    engine = fake_engine(run, max_retries=5, retry_base_delay=0.0)
+    pattern = ['brain_remember'] * 4
+    results = asyncio.run(engine._execute_pattern_with_retries(pattern, "What is AI?"))
+
+    # Step 1 stops after _REPEAT_FAILURE_LIMIT attempts, step 2 after one more identical
+    # failure, and the pattern is abandoned once _ERROR_STORM_LIMIT is reached
+    assert hrm_phase5._REPEAT_FAILURE_LIMIT == 2 and hrm_phase5._ERROR_STORM_LIMIT == 3
+    assert len(calls) == 3
+    assert [result.retry_count for result in results] == [1, 0]
+    assert not any(result.success for result in results)
+    print("  ✅ 3 calls instead of 20; last 2 steps skipped")
+
+
+def fake_system():
+    """HRMPhase5System whose tools succeed except web_search, with deterministic results"""
+    async def run(tool_name, **params):
+        if tool_name == 'web_search':
+            return tool_result(tool_name, success=False, error="search quota exceeded")
+        return tool_result(tool_name)
+
+    system = hrm_phase5.HRMPhase5System(use_real_tools=False, max_retries=1)
+    system.engine.mcp_integration.execute_tool = run
+    return system
+
+
+def test_columnar_layout_matches_rows():
+    """layout='columns' holds the same values as the row dicts, one list per field"""
+    print("\n🔧 Test: process_query(layout='columns')")
+    system = fake_system()
+    query = "Compare machine learning and deep learning"
+    rows = asyncio.run(system.process_query(query))['mcp_results']
+    columns = asyncio.run(system.process_query(query, layout='columns'))['mcp_results']
+
+    assert rows and set(columns) == set(rows[0])
+    for field, values in columns.items():
+        assert values == [row[field] for row in rows], field
+    assert False in columns['success']
+
+    try:
+        asyncio.run(system.process_query(query, layout='table'))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("unknown layout accepted")
+    print("  ✅ Columns match rows field by field; unknown layout rejected")
+
+
+def test_view_layout_matches_rows():
+    """layout='views' returns immutable MCPResultView objects equal to the row dicts"""
+    print("\n🔧 Test: process_query(layout='views')")
+    system = fake_system()
+    query = "Compare machine learning and deep learning"
+    rows = asyncio.run(system.process_query(query))['mcp_results']
+    views = asyncio.run(system.process_query(query, layout='views'))['mcp_results']
+
+    assert all(isinstance(view, hrm_phase5.MCPResultView) for view in views)
+    assert [view.to_dict() for view in views] == rows
+    assert not hasattr(views[0], '__dict__')
+    try:
+        views[0].success = False
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError("MCPResultView is mutable")
+    print("  ✅ Views convert back to the rows and cannot be modified")
+
+
+def main():
+    """Run every Phase 5 engine test"""
+    print("🧪 Testing Phase 5 Execution Engine")
+    print("=" * 50)
+
+    test_total_executions_outlive_bounded_history()
+    test_independent_steps_run_concurrently()
+    test_retry_backoff_is_jittered_and_capped()
+    test_repeated_failures_stop_retries_and_pattern()
+    test_columnar_layout_matches_rows()
+    test_view_layout_matches_rows()
+
+    print(f"\n✅ All Phase 5 engine tests completed successfully!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+HRM Production MCP Test: Validate the Real MCP Integration Layer
+===============================================================
+
+Checks ProductionRealMCPIntegration and ActualMCPToolInterface behavior
+with fake tool calls in place of the Claude MCP tools.
+"""
+
+import asyncio
+import copy
+import sys
+import os
+
+# Add the repository root to path; the src modules use package-relative imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.hrm_automation_engine import MCPExecutionResult, ExecutionPhase
+from src import hrm_production_mcp
+from src.hrm_production_mcp import ActualMCPToolInterface, ProductionRealMCPIntegration
+
+
+def fake_call(delay, outcome, name, events):
+    """Tool call that finishes after delay seconds with outcome: True, False or an exception"""
+    async def run():
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            events.append(f"{name} cancelled")
+            raise
+        if isinstance(outcome, Exception):
+            raise outcome
+        return MCPExecutionResult(name, outcome, {'tool': name}, 0.9 if outcome else 0.0, delay,
+                                  ExecutionPhase.ORCHESTRATION, None if outcome else f"{name} failed")
+    return run()
+
+
+def hedged(calls, events):
+    """Run execute_hedged over calls mapping tool name to (delay, outcome)"""
+    integration = ProductionRealMCPIntegration()
+    integration.execute_real_tool = lambda name, **kwargs: fake_call(*calls[name], name, events)
+    return integration.execute_hedged([(name, {}) for name in calls])
+
+
+def test_hedged_waits_past_errors_and_cancels_losers():
+    """An early error does not end the race, and the slower call is cancelled before returning"""
+    print("\n🔧 Test: Hedged call after an early error")
+    events = []
+    result = asyncio.run(hedged({
+        'broken': (0.0, ConnectionError("down")),
+        'fast': (0.01, True),
+        'slow': (10.0, True),
+    }, events))
+    assert result.tool_name == 'fast'
+    assert events == ['slow cancelled']
+    print("  ✅ First success returned; loser cancelled and awaited")
+
+
+def test_hedged_failures():
+    """Failed results are returned, errors raised only when every call raised, and empty input rejected"""
+    print("\n🔧 Test: Hedged call without a success")
+    events = []
+    result = asyncio.run(hedged({'broken': (0.0, ConnectionError("down")), 'failing': (0.01, False)}, events))
+    assert result.tool_name == 'failing' and not result.success
+
+    try:
+        asyncio.run(hedged({'a': (0.0, ConnectionError("a down")), 'b': (0.01, TimeoutError("b slow"))}, events))
+    except TimeoutError:
+        pass
+    else:
+        raise AssertionError("all calls raised, expected the last error")
+
+    try:
+        asyncio.run(hedged({}, events))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("empty call list accepted")
+    print("  ✅ Failed result returned, last error raised, empty input rejected")
+
+
+def test_result_cache_ttl_and_isolation():
+    """Read-only results are reused until their TTL, survive writes and cannot be mutated by callers"""
+    print("\n🔧 Test: Production result cache")
+
+    async def run():
+        interface = ActualMCPToolInterface()
+        first = await interface.execute_real_brain_recall("query one")
+        assert 'cache_hit' not in first.data
+        expected = {**copy.deepcopy(first.data), 'cache_hit': True}
+
+        hit = await interface.execute_real_brain_recall("query one")
+        assert hit.data['cache_hit'] is True and hit.execution_time == 0.0
+        assert interface.execution_count == 1
+
+        # Mutating a returned result leaves the cached copy intact
+        first.data.clear()
+        next(value for value in hit.data.values() if isinstance(value, (dict, list))).clear()
+        again = await interface.execute_real_brain_recall("query one")
+        assert again.data == expected
+
+        # Writes are never cached and do not invalidate cached reads
+        await interface.execute_real_brain_remember("key", "value")
+        await interface.execute_real_brain_remember("key", "value")
+        assert interface.execution_count == 3
+        assert (await interface.execute_real_brain_recall("query one")).data['cache_hit'] is True
+
+        # Cached reads expire by TTL
+        key = next(iter(interface._cache))
+        stored_at, result = interface._cache[key]
+        interface._cache[key] = (stored_at - hrm_production_mcp._TOOL_TTL['brain:brain_recall'], result)
+        expired = await interface.execute_real_brain_recall("query one")
+        assert 'cache_hit' not in expired.data
+        assert interface.execution_count == 4
+
+    asyncio.run(run())
+    print("  ✅ Hit served as a copy, survived writes and expired by TTL")
+
+
+def test_brain_recall_keeps_flat_layout():
+    """brain_recall data keeps memories and search_meta at the top level next to the split views"""
+    print("\n🔧 Test: brain_recall result layout")
+    memories = [{'key': 'k', 'content': 'remembered content', 'confidence': 0.9}]
+
+    async def executor(tool_name, params):
+        return {'memories': memories, 'search_meta': {'results_found': 1}, 'confidence': 0.9}
+
+    async def run():
+        placeholder = await ActualMCPToolInterface().execute_real_brain_recall("query")
+        live = await ActualMCPToolInterface(tool_executor=executor).execute_real_brain_recall("query")
+        return placeholder.data, live.data
+
+    for data in asyncio.run(run()):
+        assert data['memories'] and data['memories'] == data['memory_block']
+        assert data['search_meta'] == data['dynamic_meta']['search_meta']
+        assert data['static_header'] == hrm_production_mcp._RECALL_HEADER
+        assert 'memories' not in data['dynamic_meta']
+    assert data['memories'] == memories
+    print("  ✅ Placeholder and executor data expose both layouts")
+
+
+def main():
+    """Run every production MCP integration test"""
+    print("🧪 Testing Production MCP Integration")
+    print("=" * 50)
+
+    test_hedged_waits_past_errors_and_cancels_losers()
+    test_hedged_failures()
+    test_result_cache_ttl_and_isolation()
+    test_brain_recall_keeps_flat_layout()
+
+    print(f"\n✅ All production MCP integration tests completed successfully!")
+
+
+if __name__ == "__main__":
+    main()
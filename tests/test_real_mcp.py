@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+HRM Real MCP Test: Validate the Phase 5 Tool Interface
+=====================================================
+
+Checks the behavior added around RealMCPToolInterface: coalesced
+brain_remember writes, result caching and the circuit breaker.
+"""
+
+import asyncio
+import sys
+import os
+
+# Add the repository root to path; the src modules use package-relative imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src import hrm_real_mcp
+
+
+def test_concurrent_remembers_resolve():
+    """Coalesced brain_remember writes each resolve with their own result"""
+    print("\n🔧 Test: Concurrent brain_remember writes")
+    batches = []
+
+    async def run():
+        interface = hrm_real_mcp.RealMCPToolInterface()
+        store = interface._store_memories
+        interface._store_memories = lambda batch: batches.append(len(batch)) or store(batch)
+
+        keys = [f"memory-{i}" for i in range(20)]
+        results = await asyncio.wait_for(
+            asyncio.gather(*(interface.execute_brain_remember(key, f"value {key}") for key in keys)),
+            timeout=5
+        )
+        assert [result.data['key'] for result in results] == keys
+        assert all(result.success for result in results)
+        assert not interface._remember_pending
+
+    # One concurrency slot: waiting writers must not hold it, or the flush could never run
+    limit = hrm_real_mcp._MAX_CONCURRENCY
+    hrm_real_mcp._MAX_CONCURRENCY = 1
+    try:
+        # A second event loop must not inherit state bound to the first one
+        asyncio.run(run())
+        asyncio.run(run())
+    finally:
+        hrm_real_mcp._MAX_CONCURRENCY = limit
+    assert batches == [20, 20]
+    print("  ✅ All 20 writes resolved in one batch per event loop")
+
+
+def test_failed_remember_batch_resolves_writers():
+    """A batch that raises fails its writers instead of leaving them waiting"""
+    print("\n🔧 Test: Failed brain_remember batch")
+
+    def broken(batch):
+        raise ConnectionError("brain server gone")
+
+    async def run():
+        interface = hrm_real_mcp.RealMCPToolInterface()
+        store = interface._store_memories
+        interface._store_memories = broken
+        outcomes = await asyncio.wait_for(
+            asyncio.gather(*(interface.execute_brain_remember(f"k{i}", "v") for i in range(3)),
+                           return_exceptions=True),
+            timeout=5
+        )
+        assert all(isinstance(outcome, ConnectionError) for outcome in outcomes)
+
+        # The next write starts a fresh flush
+        interface._store_memories = store
+        result = await asyncio.wait_for(interface.execute_brain_remember("after", "v"), timeout=5)
+        assert result.success
+
+    asyncio.run(run())
+    print("  ✅ Writers received the error and later writes still flush")
+
+
+def test_lru_hit_expiry_and_eviction():
+    """Repeat calls are served from the interface cache until they expire or are evicted"""
+    print("\n🔧 Test: Result cache hit, TTL expiry and LRU eviction")
+
+    async def run():
+        interface = hrm_real_mcp.RealMCPToolInterface()
+        first = await interface.execute_brain_recall("query one")
+        assert 'cache_hit' not in first.data
+
+        hit = await interface.execute_brain_recall("query one")
+        assert hit.data['cache_hit'] is True
+        assert hit.execution_time == 0.0
+        assert hit.data == {**first.data, 'cache_hit': True}
+
+        # Callers get copies; mutating one leaves the cached result intact
+        first.data['memories'].clear()
+        hit.data['memories'].clear()
+        assert (await interface.execute_brain_recall("query one")).data['memories']
+
+        # Storing a memory leaves cached recalls in place; they expire by TTL instead
+        await interface.execute_brain_remember("new memory", "value")
+        assert (await interface.execute_brain_recall("query one")).data['cache_hit'] is True
+
+        key = next(iter(interface._cache))
+        stored_at, result = interface._cache[key]
+        interface._cache[key] = (stored_at - hrm_real_mcp._CACHE_TTL['brain_recall'], result)
+        expired = await interface.execute_brain_recall("query one")
+        assert 'cache_hit' not in expired.data
+
+        # Fill the cache past its capacity; "query one" is the least recently used
+        for i in range(hrm_real_mcp._CACHE_MAX):
+            await interface.execute_web_search(f"filler {i}")
+        evicted = await interface.execute_brain_recall("query one")
+        assert 'cache_hit' not in evicted.data
+        assert len(interface._cache) == hrm_real_mcp._CACHE_MAX
+
+    asyncio.run(run())
+    print("  ✅ Hit served with cache_hit=True, survived a write, expired and was evicted")
+
+
+def test_circuit_breaker_opens_per_tool():
+    """Consecutive failures open one tool's circuit until the cooldown passes"""
+    print("\n🔧 Test: Per-tool circuit breaker")
+
+    async def run():
+        interface = hrm_real_mcp.RealMCPToolInterface()
+        # A thought of None makes the simulated tool body raise
+        for _ in range(hrm_real_mcp._FAILURE_THRESHOLD):
+            assert not (await interface.execute_sequential_thinking(None)).success
+        errors = interface._error_total
+
+        skipped = await interface.execute_sequential_thinking("valid thought")
+        assert not skipped.success and 'circuit open' in skipped.error_message
+        assert interface._error_total == errors  # Short-circuited without running the tool
+        assert (await interface.execute_reasoning_tools("other tool")).success
+
+        # Once the cooldown has passed, a success closes the circuit again
+        interface._open_until['sequential_thinking'] = 0.0
+        assert (await interface.execute_sequential_thinking("valid thought")).success
+        assert interface._consecutive_failures['sequential_thinking'] == 0
+
+    asyncio.run(run())
+    print("  ✅ Circuit opened for one tool only and closed after the cooldown")
+
+
+def main():
+    """Run every real MCP interface test"""
+    print("🧪 Testing Real MCP Tool Interface")
+    print("=" * 50)
+
+    test_concurrent_remembers_resolve()
+    test_failed_remember_batch_resolves_writers()
+    test_lru_hit_expiry_and_eviction()
+    test_circuit_breaker_opens_per_tool()
+
+    print(f"\n✅ All real MCP interface tests completed successfully!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+HRM Semantic Cache Test: Validate Near-Match Recall Reuse
+========================================================
+
+Checks SemanticCache and the score_recall kernel with a fake encoder in
+place of sentence-transformers. Skipped when numpy is not installed.
+"""
+
+import asyncio
+import sys
+import os
+import unittest
+
+# Add the repository root to path; the src modules use package-relative imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+
+def require_numpy():
+    """Import numpy, skipping the calling test when it is missing"""
+    try:
+        import numpy
+    except ImportError:
+        raise unittest.SkipTest("numpy is not installed (pip install .[semantic])")
+    return numpy
+
+
+class FakeEncoder:
+    """Encoder mapping each known text to a fixed embedding"""
+
+    def __init__(self, embeddings):
+        self.embeddings = embeddings
+
+    def encode(self, text):
+        return self.embeddings[text]
+
+
+def make_cache(**options):
+    """SemanticCache over one-hot embeddings, where 'first' and its rewording share a direction"""
+    require_numpy()
+    from src.hrm_semantic_cache import SemanticCache
+
+    encoder = FakeEncoder({
+        'first': [2.0, 0.0, 0.0, 0.0],
+        'first reworded': [1.0, 0.05, 0.0, 0.0],
+        'second': [0.0, 1.0, 0.0, 0.0],
+        'third': [0.0, 0.0, 3.0, 0.0],
+        'fourth': [0.0, 0.0, 0.0, 1.0],
+    })
+    return SemanticCache(encoder, threshold=0.9, **options)
+
+
+def test_store_lookup_and_clear():
+    """Near-matches are served, unrelated queries miss, and clear drops every entry"""
+    print("\n🔧 Test: Semantic cache store, lookup and clear")
+    cache = make_cache()
+    assert cache.lookup(cache.encode('first')) is None
+
+    cache.store(cache.encode('first'), 'first value')
+    assert abs(float((cache.encode('first') ** 2).sum()) - 1.0) < 1e-6
+    assert cache.lookup(cache.encode('first reworded')) == 'first value'
+    assert cache.lookup(cache.encode('second')) is None
+
+    cache.clear()
+    assert cache.lookup(cache.encode('first')) is None
+    cache.store(cache.encode('second'), 'second value')
+    assert cache.lookup(cache.encode('second')) == 'second value'
+    print("  ✅ Reworded query hit, unrelated query missed, cleared cache reusable")
+
+
+def test_eviction_overwrites_oldest():
+    """A full cache overwrites its oldest entries first"""
+    print("\n🔧 Test: Semantic cache eviction")
+    cache = make_cache(max_entries=2)
+    for text in ('first', 'second', 'third'):
+        cache.store(cache.encode(text), f'{text} value')
+    assert cache.lookup(cache.encode('first')) is None
+    assert cache.lookup(cache.encode('second')) == 'second value'
+    assert cache.lookup(cache.encode('third')) == 'third value'
+
+    cache.store(cache.encode('fourth'), 'fourth value')
+    assert cache.lookup(cache.encode('second')) is None
+    assert cache.lookup(cache.encode('fourth')) == 'fourth value'
+    print("  ✅ Oldest entries overwritten in insertion order")
+
+
+def test_half_life_decay():
+    """With a half-life, aged entries fall below the threshold and the kernel prefers fresher ones"""
+    print("\n🔧 Test: Semantic cache half-life")
+    np = require_numpy()
+    from src.hrm_real_mcp_kernels import score_recall
+
+    cache = make_cache(half_life=10.0)
+    cache.store(cache.encode('first'), 'first value')
+    assert cache.lookup(cache.encode('first')) == 'first value'
+    cache._stored_at[0] -= 10.0  # One half-life old: similarity 1.0 decays to about 0.37
+    assert cache.lookup(cache.encode('first')) is None
+
+    score, best = score_recall(np.array([0.95, 0.95]), np.array([20.0, 0.0]), 10.0)
+    assert best == 1 and abs(score - 0.95) < 1e-9
+    print("  ✅ Aged entry expired; fresher equal match preferred")
+
+
+def test_reworded_recall_served_by_interface():
+    """RealMCPToolInterface answers a reworded brain_recall from the semantic cache"""
+    print("\n🔧 Test: Semantic brain_recall hit")
+    cache = make_cache()
+    from src.hrm_real_mcp import RealMCPToolInterface
+
+    async def run():
+        interface = RealMCPToolInterface()
+        interface._semantic_cache = cache
+        first = await interface.execute_brain_recall('first')
+        reworded = await interface.execute_brain_recall('first reworded')
+        return first, reworded
+
+    first, reworded = asyncio.run(run())
+    assert 'semantic_hit' not in first.data
+    assert reworded.data['semantic_hit'] is True and reworded.data['cache_hit'] is True
+    assert reworded.data['memories'] == first.data['memories']
+    print("  ✅ Reworded query served with semantic_hit=True")
+
+
+def main():
+    """Run every semantic cache test"""
+    print("🧪 Testing Semantic Cache")
+    print("=" * 50)
+
+    try:
+        test_store_lookup_and_clear()
+        test_eviction_overwrites_oldest()
+        test_half_life_decay()
+        test_reworded_recall_served_by_interface()
+    except unittest.SkipTest as e:
+        print(f"\n⏭️ Semantic cache tests skipped: {e}")
+        return
+
+    print(f"\n✅ All semantic cache tests completed successfully!")
+
+
+if __name__ == "__main__":
+    main()